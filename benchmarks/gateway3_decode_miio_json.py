@@ -0,0 +1,143 @@
+"""Benchmark decode_miio_json on gateway log/miio lines.
+
+Compares the current decoder to the previous one, which used two regexes
+and split copies of the line. Every line is searched three times, as the
+gateway does for properties_changed, event_occured and BLE events. The
+time without json.loads shows the cost of the line handling alone.
+
+Lines come from a recorded log/miio MQTT payload dump, one payload per
+line, or from built-in lines in the same format.
+
+Needs the xiaomi_gateway3 requirements (zigpy, cryptography), not Home
+Assistant.
+
+Usage: python benchmarks/gateway3_decode_miio_json.py [--log miio.log]
+"""
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+import timeit
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SEARCHES = (b"properties_changed", b"event_occured", b"_async.ble_event")
+
+RE_JSON1 = re.compile(b"msg:(.+) length:([0-9]+) bytes")
+RE_JSON2 = re.compile(b"{.+}")
+
+
+def decode_miio_json_regex(raw: bytes, search: bytes) -> list:
+    """The decoder before the change."""
+    if search not in raw:
+        return []
+    m = RE_JSON1.search(raw)
+    if m:
+        raw = m[1][:int(m[2])]
+    else:
+        raw = RE_JSON2.search(raw)[0]
+    items = raw.replace(b"}{", b"}\n{").split(b"\n")
+    return [json.loads(raw) for raw in items if search in raw]
+
+
+def load_miot():
+    # skip the integration __init__, it needs Home Assistant; a top level
+    # xiaomi_gateway3 module is where the external converters are loaded from
+    for name in ("custom_components", "custom_components.xiaomi_gateway3"):
+        package = types.ModuleType(name)
+        package.__path__ = [os.path.join(ROOT, *name.split(".")[1:])]
+        sys.modules[name] = package
+    return importlib.import_module(
+        "custom_components.xiaomi_gateway3.core.gateway.miot"
+    )
+
+
+def sample_lines() -> list:
+    def dumps(data: dict) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    props = dumps({
+        "method": "properties_changed", "id": 1234,
+        "params": [
+            {"did": f"12345678{i}", "siid": 2, "piid": 1, "value": i}
+            for i in range(3)
+        ]
+    })
+    ble = dumps({
+        "method": "_async.ble_event", "id": 99,
+        "params": {
+            "dev": {"did": "blt.3.abc", "mac": "AA:BB:CC:DD:EE:FF", "pdid": 1371},
+            "evt": [{"eid": 4100, "edata": "e400"}],
+            "frmCnt": 12, "gwts": 1650000000
+        }
+    })
+    heartbeat = dumps({
+        "method": "event.gw.heartbeat", "id": 1,
+        "params": [{
+            "free_mem": 5000, "ip": "192.168.1.2", "load_avg": "1.2",
+            "rssi": -50, "uptime": 1000
+        }]
+    })
+    msg = props + ble + props
+    return [
+        b"\x1b[0;32m[20220101 12:00:00] ot_agent_recv_handler_one(): fd:8, "
+        b"msg:" + msg + b" length:%d bytes\x1b[0m" % len(msg),
+        b"ot_agent_recv_handler_one(): fd:8, msg:" + ble +
+        b" length:%d bytes" % len(ble),
+        b"[D] miio_client_rpc: " + heartbeat,
+        b"[D] some unrelated log line without json at all, rssi -50",
+    ] * 25
+
+
+def run(decode, lines: list):
+    for line in lines:
+        for search in SEARCHES:
+            decode(line, search)
+
+
+def per_line(decode, lines: list) -> float:
+    number = max(1, 20000 // len(lines))
+    t = min(timeit.repeat(lambda: run(decode, lines), number=number, repeat=5))
+    return t / number / len(lines) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--log", help="file with one log/miio payload per line")
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log, "rb") as f:
+            lines = [line.rstrip(b"\r\n") for line in f if line.strip()]
+    else:
+        lines = sample_lines()
+
+    miot = load_miot()
+    decoders = {
+        "regex": decode_miio_json_regex,
+        "current": miot.decode_miio_json,
+    }
+    for line in lines:
+        for search in SEARCHES:
+            assert decode_miio_json_regex(line, search) == \
+                miot.decode_miio_json(line, search), line
+
+    print(f"{len(lines)} lines, {len(SEARCHES)} searches per line")
+    for name, decode in decoders.items():
+        print(f"{name:>8}: {per_line(decode, lines):.1f} us/line")
+
+    # line handling alone, without parsing
+    loads = json.loads
+    json.loads = len
+    try:
+        for name, decode in decoders.items():
+            print(f"{name:>8}: {per_line(decode, lines):.1f} us/line without json.loads")
+    finally:
+        json.loads = loads
+
+
+if __name__ == "__main__":
+    main()
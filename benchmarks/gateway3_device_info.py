@@ -0,0 +1,116 @@
+"""Benchmark the Gateway3 converters import and device info lookup.
+
+Measures the import of the converters package with the devices.py tables,
+the build of the model and default type index, and get_device_info for
+every model in DEVICES. The lookup is compared to the previous linear scan
+over DEVICES, and both must return the same info for every model and type.
+
+Needs the xiaomi_gateway3 requirements (zigpy), not Home Assistant.
+
+Usage: python benchmarks/gateway3_device_info.py
+"""
+import importlib
+import os
+import sys
+import time
+import timeit
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TYPES = ("zigbee", "ble", "mesh", "gateway")
+
+
+def load_converters():
+    # skip the integration __init__, it needs Home Assistant; a top level
+    # xiaomi_gateway3 module is where the external converters are loaded from
+    for name in ("custom_components", "custom_components.xiaomi_gateway3"):
+        package = types.ModuleType(name)
+        package.__path__ = [os.path.join(ROOT, *name.split(".")[1:])]
+        sys.modules[name] = package
+    return importlib.import_module(
+        "custom_components.xiaomi_gateway3.core.converters"
+    )
+
+
+def get_device_info_scan(conv, model, type):
+    """The lookup before the change."""
+    for desc in conv.DEVICES:
+        if model not in desc and desc.get("default") != type:
+            continue
+        info = desc.get(model) or ["Unknown", type.upper(), None]
+        brand, name, market = info if len(info) == 3 else info + [None]
+
+        if type == conv.ZIGBEE and not conv.is_mihome_zigbee(model):
+            url = "https://www.zigbee2mqtt.io/supported-devices/#s=" + market \
+                if market else None
+        else:
+            url = f"https://home.miot-spec.com/s/{model}"
+
+        if market and type == conv.ZIGBEE:
+            market = f"{type} {market} ({model})"
+        elif market:
+            market = f"{type} {market}"
+        else:
+            market = f"{type} ({model})"
+
+        ttl = desc.get("ttl")
+        if isinstance(ttl, str):
+            ttl = conv.parse_time(ttl)
+
+        return conv.XDeviceInfo(
+            manufacturer=brand,
+            model=market,
+            name=f"{brand} {name}",
+            url=url,
+            spec=desc["spec"],
+            ttl=ttl
+        )
+    raise RuntimeError
+
+
+def info_or_error(get_device_info, model, type):
+    try:
+        return vars(get_device_info(model, type))
+    except (RuntimeError, AttributeError) as e:
+        # unknown model, or a BLE/mesh int model with the zigbee type
+        return e.__class__
+
+
+def main():
+    t = time.perf_counter()
+    conv = load_converters()
+    print(f"import converters: {(time.perf_counter() - t) * 1e3:.1f} ms")
+
+    t = time.perf_counter()
+    conv.get_devices_index()
+    print(f"build index: {(time.perf_counter() - t) * 1e3:.2f} ms")
+
+    models = [
+        model for desc in conv.DEVICES for model, info in desc.items()
+        if model != "spec" and isinstance(info, list)
+    ]
+    models += ["unknown.model", 99999]
+    scan = lambda model, type: get_device_info_scan(conv, model, type)
+    for model in models:
+        for type in TYPES:
+            assert info_or_error(scan, model, type) == \
+                info_or_error(conv.get_device_info, model, type), (model, type)
+
+    lookups = [(model, type) for model in models for type in TYPES]
+
+    def run(get_device_info):
+        for model, type in lookups:
+            try:
+                get_device_info(model, type)
+            except (RuntimeError, AttributeError):
+                pass
+
+    print(f"{len(models)} models, {len(TYPES)} types")
+    for name, get_device_info in (("scan", scan), ("index", conv.get_device_info)):
+        t = min(timeit.repeat(lambda: run(get_device_info), number=5, repeat=5))
+        print(f"{name:>6}: {t / 5 / len(lookups) * 1e6:.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark MQTT subscription matching against the subscription count.
+
+Compares SubscriptionTrie.match, with its per-topic cache cleared before
+every message, to the linear scan that ran every subscription matcher
+against each topic. Topics look like zigbee2mqtt state messages, plus a
+few wildcard subscriptions as Home Assistant creates them.
+
+Usage: python benchmarks/mqtt_topic_trie.py [--sizes 100 1000 5000]
+"""
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_topic_trie():
+    # load the module alone, the mqtt package needs Home Assistant
+    path = os.path.join(ROOT, "mqtt", "topic_trie.py")
+    spec = importlib.util.spec_from_file_location("topic_trie", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def matcher_for_topic(subscription: str):
+    """Same matcher as mqtt._matcher_for_topic, if paho-mqtt is installed."""
+    try:
+        from paho.mqtt.matcher import MQTTMatcher
+    except ImportError:
+        return lambda topic: topic_matches(subscription, topic)
+
+    matcher = MQTTMatcher()
+    matcher[subscription] = True
+    return lambda topic: next(matcher.iter_match(topic), False)
+
+
+def topic_matches(subscription: str, topic: str) -> bool:
+    if topic.startswith("$") and subscription[:1] in ("+", "#"):
+        return False
+    levels = subscription.split("/")
+    parts = topic.split("/")
+    for index, level in enumerate(levels):
+        if level == "#":
+            return True
+        if index >= len(parts) or level not in ("+", parts[index]):
+            return False
+    return len(levels) == len(parts)
+
+
+class Subscription:
+    def __init__(self, topic: str):
+        self.topic = topic
+        self.matcher = matcher_for_topic(topic)
+
+
+def run(trie_cls, size: int, count: int, rnd: random.Random) -> tuple:
+    subs = [Subscription(f"zigbee2mqtt/device{i}/state") for i in range(size)]
+    subs += [
+        Subscription("zigbee2mqtt/+/availability"),
+        Subscription("homeassistant/#"),
+        Subscription("zigbee2mqtt/bridge/#"),
+    ]
+    trie = trie_cls()
+    for sub in subs:
+        trie.insert(sub)
+
+    topics = [
+        f"zigbee2mqtt/device{rnd.randrange(size)}/state" for _ in range(count)
+    ]
+    topics += ["zigbee2mqtt/bridge/state", "$SYS/broker/uptime"]
+    for topic in topics:
+        assert trie.match(topic) == [s for s in subs if s.matcher(topic)]
+
+    t = time.perf_counter()
+    for topic in topics:
+        trie._cache.clear()
+        trie.match(topic)
+    trie_rate = len(topics) / (time.perf_counter() - t)
+
+    # the linear scan is slow with many subscriptions, time a part only
+    sample = topics[:max(20, count * 100 // size)]
+    t = time.perf_counter()
+    for topic in sample:
+        [s for s in subs if s.matcher(topic)]
+    scan_rate = len(sample) / (time.perf_counter() - t)
+
+    return trie_rate, scan_rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--topics", type=int, default=2000)
+    args = parser.parse_args()
+
+    trie_cls = load_topic_trie().SubscriptionTrie
+    rnd = random.Random(1)
+    print(f"{'subscriptions':>13} {'trie msg/s':>12} {'scan msg/s':>12}")
+    for size in args.sizes:
+        trie_rate, scan_rate = run(trie_cls, size, args.topics, rnd)
+        print(f"{size:>13} {trie_rate:>12,.0f} {scan_rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
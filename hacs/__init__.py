@@ -30,6 +30,7 @@ from .const import DOMAIN, MINIMUM_HA_VERSION, STARTUP
 from .enums import ConfigurationType, HacsDisabledReason, HacsStage, LovelaceMode
 from .utils.configuration_schema import hacs_config_combined
 from .utils.data import HacsData
+from .utils.download_cache import DownloadCache
 from .utils.queue_manager import QueueManager
 from .utils.version import version_left_higher_or_equal_then_right
 from .websocket import async_register_websocket_commands
@@ -87,6 +88,7 @@ async def async_initialize_integration(
     hacs.configuration.dev = integration.version == "0.0.0"
     hacs.hass = hass
     hacs.queue = QueueManager(hass=hass)
+    hacs.download_cache = DownloadCache(hass, hass.config.path(".cache", "hacs"))
     hacs.data = HacsData(hacs=hacs)
     hacs.system.running = True
     hacs.session = clientsession
@@ -7,7 +7,6 @@ from datetime import timedelta
 import gzip
 import json
 import logging
-import math
 import os
 import pathlib
 import shutil
@@ -23,7 +22,7 @@ from aiogithubapi import (
     GitHubRatelimitException,
 )
 from aiogithubapi.objects.repository import AIOGitHubAPIRepository
-from aiohttp.client import ClientSession, ClientTimeout
+from aiohttp.client import ClientResponse, ClientSession, ClientTimeout
 from awesomeversion import AwesomeVersion
 from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
@@ -32,7 +31,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.loader import Integration
 from homeassistant.util import dt
 
-from .const import TV
+from .const import DOWNLOAD_CHUNK_SIZE, TV
 from .enums import (
     ConfigurationType,
     HacsCategory,
@@ -41,6 +40,7 @@ from .enums import (
     HacsGitHubRepo,
     HacsStage,
     LovelaceMode,
+    QueuePriority,
 )
 from .exceptions import (
     AddonRepositoryException,
@@ -52,13 +52,15 @@ from .exceptions import (
     HomeAssistantCoreRepositoryException,
 )
 from .repositories import RERPOSITORY_CLASSES
+from .repositories.base import next_revision
 from .utils.decode import decode_content
+from .utils.download_cache import DownloadCache
 from .utils.logger import get_hacs_logger
 from .utils.queue_manager import QueueManager
 from .utils.store import async_load_from_store, async_save_to_store
 
 if TYPE_CHECKING:
-    from .repositories.base import HacsRepository
+    from .repositories.base import HacsRepository, RepositoryStub
     from .utils.data import HacsData
     from .validate.manager import ValidationManager
 
@@ -191,6 +193,7 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, str] = field(default_factory=dict)
     _repositories_by_id: dict[str, str] = field(default_factory=dict)
     _removed_repositories: list[RemovedRepository] = field(default_factory=list)
+    _unregistered: dict[str, int] = field(default_factory=dict)
 
     @property
     def list_all(self) -> list[HacsRepository]:
@@ -222,6 +225,7 @@ class HacsRepositories:
 
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
+        self._unregistered.pop(repo_id, None)
 
         if default:
             self.mark_default(repository)
@@ -244,6 +248,24 @@ class HacsRepositories:
 
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
+        self._unregistered[repo_id] = next_revision()
+
+    def unregistered_since(self, revision: int) -> list[str]:
+        """Return the ids of repositories unregistered after a revision."""
+        return [
+            repo_id
+            for repo_id, unregistered in self._unregistered.items()
+            if unregistered > revision
+        ]
+
+    def replace(self, stub: RepositoryStub, repository: HacsRepository) -> None:
+        """Replace a repository stub with the full repository."""
+        if stub not in self._repositories:
+            return
+
+        self._repositories[self._repositories.index(stub)] = repository
+        self._repositories_by_id[str(repository.data.id)] = repository
+        self._repositories_by_full_name[repository.data.full_name_lower] = repository
 
     def mark_default(self, repository: HacsRepository) -> None:
         """Mark a repository as default."""
@@ -342,6 +364,7 @@ class HacsBase:
     configuration = HacsConfiguration()
     core = HacsCore()
     data: HacsData | None = None
+    download_cache: DownloadCache | None = None
     frontend_version: str | None = None
     github: GitHub | None = None
     githubapi: GitHubAPI | None = None
@@ -449,8 +472,10 @@ class HacsBase:
         """Helper to calculate the number of repositories we can fetch data for."""
         try:
             response = await self.async_github_api_method(self.githubapi.rate_limit)
-            if ((limit := response.data.resources.core.remaining or 0) - 1000) >= 10:
-                return math.floor((limit - 1000) / 10)
+            core = response.data.resources.core
+            self.queue.rate_limit.update(core.remaining or 0, core.reset, core.limit)
+            if (can_update := self.queue.rate_limit.tokens) > 0:
+                return can_update
             reset = dt.as_local(dt.utc_from_timestamp(response.data.resources.core.reset))
             self.log.info(
                 "GitHub API ratelimited - %s remaining (%s)",
@@ -486,7 +511,10 @@ class HacsBase:
         _exception = None
 
         try:
-            return await method(*args, **kwargs)
+            response = await method(*args, **kwargs)
+            if self.queue is not None and (headers := getattr(response, "headers", None)):
+                self.queue.rate_limit.update_from_headers(headers)
+            return response
         except GitHubAuthenticationException as exception:
             self.disable_hacs(HacsDisabledReason.INVALID_TOKEN)
             _exception = exception
@@ -676,6 +704,59 @@ class HacsBase:
 
     async def async_download_file(self, url: str, *, headers: dict | None = None) -> bytes | None:
         """Download files, and return the content."""
+
+        async def _handle_response(url: str, request: ClientResponse) -> bytes | None:
+            if request.status == 304:
+                return await self.download_cache.async_read(url)
+            content = await request.read()
+            await self.download_cache.async_store(url, request.headers, content)
+            return content
+
+        return await self._async_download(url, headers, ClientTimeout(total=60), _handle_response)
+
+    async def async_download_file_to_path(
+        self,
+        url: str,
+        file_path: str,
+        *,
+        headers: dict | None = None,
+    ) -> bool:
+        """Download a file in chunks to a temporary file and move it to file_path."""
+
+        async def _handle_response(url: str, request: ClientResponse) -> bool | None:
+            temp_file = f"{file_path}.download"
+            if request.status == 304:
+                if not await self.download_cache.async_copy(url, temp_file):
+                    return None
+            else:
+                file_handler = await self.hass.async_add_executor_job(open, temp_file, "wb")
+                try:
+                    async for chunk in request.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await self.hass.async_add_executor_job(file_handler.write, chunk)
+                except BaseException:
+                    await self.hass.async_add_executor_job(file_handler.close)
+                    await self.hass.async_add_executor_job(os.remove, temp_file)
+                    raise
+                await self.hass.async_add_executor_job(file_handler.close)
+                await self.download_cache.async_store(url, request.headers, temp_file)
+            await self.hass.async_add_executor_job(os.replace, temp_file, file_path)
+            return True
+
+        # Large files can take longer than a minute, only time out when the data stalls
+        return bool(
+            await self._async_download(
+                url, headers, ClientTimeout(total=None, sock_read=60), _handle_response
+            )
+        )
+
+    async def _async_download(
+        self,
+        url: str | None,
+        headers: dict | None,
+        timeout: ClientTimeout,
+        handle_response: Callable[[str, ClientResponse], Awaitable[TV]],
+    ) -> TV | None:
+        """Request url, revalidating a cached copy, and handle the response."""
         if url is None:
             return None
 
@@ -683,19 +764,23 @@ class HacsBase:
             url = url.replace("tags/", "")
 
         self.log.debug("Downloading %s", url)
+        await self.download_cache.async_load()
         timeouts = 0
 
         while timeouts < 5:
             try:
                 request = await self.session.get(
                     url=url,
-                    timeout=ClientTimeout(total=60),
-                    headers=headers,
+                    timeout=timeout,
+                    headers={**(headers or {}), **self.download_cache.conditional_headers(url)},
                 )
 
                 # Make sure that we got a valid result
-                if request.status == 200:
-                    return await request.read()
+                if request.status in (200, 304):
+                    if (result := await handle_response(url, request)) is not None:
+                        return result
+                    # The cached copy is gone, download it again
+                    continue
 
                 raise HacsException(
                     f"Got status code {request.status} when trying to download {url}"
@@ -789,7 +874,7 @@ class HacsBase:
                 self.repositories.mark_default(repository)
                 if self.status.new and self.configuration.dev:
                     # Force update for new installations
-                    self.queue.add(repository.common_update())
+                    self.queue.add(repository.common_update(), QueuePriority.BACKGROUND)
                 continue
 
             self.queue.add(
@@ -797,7 +882,8 @@ class HacsBase:
                     repository_full_name=repo,
                     category=category,
                     default=True,
-                )
+                ),
+                QueuePriority.BACKGROUND,
             )
 
     async def async_update_all_repositories(self, _=None) -> None:
@@ -808,7 +894,7 @@ class HacsBase:
 
         for repository in self.repositories.list_all:
             if repository.data.category in self.common.categories:
-                self.queue.add(repository.common_update())
+                self.queue.add(repository.common_update(), QueuePriority.BACKGROUND)
 
         self.async_dispatch(HacsDispatchEvent.REPOSITORY, {"action": "reload"})
         self.log.debug("Recurring background task for all repositories done")
@@ -849,7 +935,8 @@ class HacsBase:
             )
             if can_update != 0:
                 try:
-                    await self.queue.execute(can_update)
+                    # The rate limit bucket limits the number of tasks
+                    await self.queue.execute()
                 except HacsExecutionStillInProgress:
                     return
 
@@ -903,7 +990,9 @@ class HacsBase:
 
         for repository in self.repositories.list_downloaded:
             if repository.data.category in self.common.categories:
-                self.queue.add(repository.update_repository(ignore_issues=True))
+                self.queue.add(
+                    repository.update_repository(ignore_issues=True), QueuePriority.DOWNLOADED
+                )
 
         self.log.debug("Recurring background task for downloaded repositories done")
 
@@ -14,6 +14,7 @@ PACKAGE_NAME = "custom_components.hacs"
 
 DEFAULT_CONCURRENT_TASKS = 15
 DEFAULT_CONCURRENT_BACKOFF_TIME = 1
+DOWNLOAD_CHUNK_SIZE = 512 * 1024
 
 HACS_ACTION_GITHUB_API_HEADERS = {
     "User-Agent": "HACS/action",
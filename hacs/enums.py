@@ -1,6 +1,6 @@
 """Helper constants."""
 # pylint: disable=missing-class-docstring
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class HacsGitHubRepo(str, Enum):
@@ -37,6 +37,14 @@ class HacsDispatchEvent(str, Enum):
     STATUS = "hacs_dispatch_status"
 
 
+class QueuePriority(IntEnum):
+    """Priority of queued tasks, lower runs first."""
+
+    USER = 0
+    DOWNLOADED = 1
+    BACKGROUND = 2
+
+
 class RepositoryFile(str, Enum):
     """Repository file names."""
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from asyncio import sleep
 from datetime import datetime
+from itertools import count
 import json
 import os
 import pathlib
@@ -80,6 +81,23 @@ TOPIC_FILTER = (
     "lovelace-ui",
 )
 
+# Repository attributes that are part of the repository listing in the frontend
+FRONTEND_ATTRIBUTES = (
+    "additional_info",
+    "integration_manifest",
+    "pending_restart",
+    "repository_manifest",
+    "state",
+    "updated_info",
+)
+
+_REVISIONS = count(1)
+
+
+def next_revision() -> int:
+    """Return a revision higher than every revision given out before."""
+    return next(_REVISIONS)
+
 
 class FileInformation:
     """FileInformation."""
@@ -127,6 +145,15 @@ class RepositoryData:
     stargazers_count: int = 0
     topics: List[str] = []
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute and mark the data as changed."""
+        if name not in ("dirty", "revision") and (
+            name not in self.__dict__ or self.__dict__[name] != value
+        ):
+            object.__setattr__(self, "dirty", True)
+            object.__setattr__(self, "revision", next_revision())
+        object.__setattr__(self, name, value)
+
     @property
     def name(self):
         """Return the name."""
@@ -266,6 +293,17 @@ class HacsRepository:
         self.treefiles = []
         self.ref = None
         self.logger = get_hacs_logger()
+        self.json_cache: tuple[int, dict] | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute and give the data a new revision if it is listed."""
+        if (
+            name in FRONTEND_ATTRIBUTES
+            and "data" in self.__dict__
+            and (name not in self.__dict__ or self.__dict__[name] != value)
+        ):
+            self.data.revision = next_revision()
+        object.__setattr__(self, name, value)
 
     def __str__(self) -> str:
         """Return a string representation of the repository."""
@@ -555,31 +593,27 @@ class HacsRepository:
     async def async_download_zip_file(self, content, validate) -> None:
         """Download ZIP archive from repository release."""
         try:
-            filecontent = await self.hacs.async_download_file(content.browser_download_url)
-
-            if filecontent is None:
-                validate.errors.append(f"[{content.name}] was not downloaded")
-                return
-
             temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
             temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
 
-            result = await self.hacs.async_save_file(temp_file, filecontent)
-            with zipfile.ZipFile(temp_file, "r") as zip_file:
-                zip_file.extractall(self.content.path.local)
-
             def cleanup_temp_dir():
                 """Cleanup temp_dir."""
                 if os.path.exists(temp_dir):
                     self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
                     shutil.rmtree(temp_dir)
 
-            if result:
-                self.logger.info("%s Download of %s completed", self.string, content.name)
+            if not await self.hacs.async_download_file_to_path(
+                content.browser_download_url, temp_file
+            ):
                 await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
+                validate.errors.append(f"[{content.name}] was not downloaded")
                 return
 
-            validate.errors.append(f"[{content.name}] was not downloaded")
+            with zipfile.ZipFile(temp_file, "r") as zip_file:
+                zip_file.extractall(self.content.path.local)
+
+            self.logger.info("%s Download of %s completed", self.string, content.name)
+            await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
         except BaseException:  # lgtm [py/catch-base-exception] pylint: disable=broad-except
             validate.errors.append("Download was not completed")
 
@@ -623,22 +657,19 @@ class HacsRepository:
 
         url = f"{BASE_API_URL}/repos/{self.data.full_name}/zipball/{ref}"
 
-        filecontent = await self.hacs.async_download_file(
+        temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
+        temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
+        if not await self.hacs.async_download_file_to_path(
             url,
+            temp_file,
             headers={
                 "Authorization": f"token {self.hacs.configuration.token}",
                 "User-Agent": f"HACS/{self.hacs.version}",
             },
-        )
-        if filecontent is None:
+        ):
+            await self.hacs.hass.async_add_executor_job(shutil.rmtree, temp_dir)
             raise HacsException(f"[{self}] Failed to download zipball")
 
-        temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-        temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-        result = await self.hacs.async_save_file(temp_file, filecontent)
-        if not result:
-            raise HacsException("Could not save ZIP file")
-
         with zipfile.ZipFile(temp_file, "r") as zip_file:
             extractable = []
             for path in zip_file.filelist:
@@ -1230,3 +1261,131 @@ class HacsRepository:
                 return self.data.selected_tag
 
         return self.data.default_branch or "main"
+
+
+class RepositoryStubData:
+    """Listing fields of a repository that is not created yet.
+
+    Reading any other field, or setting any field, creates the repository.
+    """
+
+    __slots__ = (
+        "_stub",
+        "category",
+        "full_name",
+        "full_name_lower",
+        "hide",
+        "id",
+        "installed",
+        "new",
+        "revision",
+        "stargazers_count",
+    )
+
+    def __init__(self, stub: RepositoryStub, entry: str, repository_data: dict) -> None:
+        """Set up the listing fields from stored data."""
+        setter = object.__setattr__
+        setter(self, "_stub", stub)
+        setter(self, "id", entry)
+        setter(self, "category", repository_data["category"])
+        setter(self, "full_name", repository_data["full_name"])
+        setter(self, "full_name_lower", repository_data["full_name"].lower())
+        setter(self, "hide", repository_data.get("hide", False))
+        setter(self, "installed", repository_data.get("installed", False))
+        setter(self, "new", repository_data.get("new", False))
+        setter(self, "revision", next_revision())
+        setter(
+            self,
+            "stargazers_count",
+            repository_data.get("stargazers_count") or repository_data.get("stars", 0),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Return a field of the created repository."""
+        return getattr(self._stub.hydrate().data, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set a field on the created repository."""
+        setattr(self._stub.hydrate().data, name, value)
+
+
+class RepositoryStub:
+    """Repository restored from storage, the full repository is created on first access."""
+
+    __slots__ = ("entry", "hacs", "repository", "repository_class", "repository_data", "stub_data")
+
+    def __init__(
+        self,
+        hacs: HacsBase,
+        repository_class: type[HacsRepository],
+        entry: str,
+        repository_data: dict,
+    ) -> None:
+        """Set up RepositoryStub."""
+        setter = object.__setattr__
+        setter(self, "hacs", hacs)
+        setter(self, "repository_class", repository_class)
+        setter(self, "entry", entry)
+        setter(self, "repository_data", repository_data)
+        setter(self, "repository", None)
+        setter(self, "stub_data", RepositoryStubData(self, entry, repository_data))
+
+    def __str__(self) -> str:
+        """Return a string representation of the repository."""
+        return self.string
+
+    @property
+    def string(self) -> str:
+        """Return a string representation of the repository."""
+        return f"<{self.data.category.title()} {self.data.full_name}>"
+
+    @property
+    def data(self) -> RepositoryData | RepositoryStubData:
+        """Return the listing fields, or the data of the created repository."""
+        if self.repository is None:
+            return self.stub_data
+        return self.repository.data
+
+    @property
+    def pending_update(self) -> bool:
+        """Return True if pending update."""
+        if self.repository is None and not self.stub_data.installed:
+            return False
+        return self.hydrate().pending_update
+
+    @property
+    def ignored_by_country_configuration(self) -> bool:
+        """Return True if hidden by country."""
+        if self.repository is not None:
+            return self.repository.ignored_by_country_configuration
+        configuration = self.hacs.configuration.country.lower()
+        if configuration == "all":
+            return False
+
+        country = self.repository_data.get("repository_manifest", {}).get("country") or []
+        if isinstance(country, str):
+            country = [country]
+        manifest = [entry.lower() for entry in country]
+        if not manifest:
+            return False
+        return configuration not in manifest
+
+    def hydrate(self) -> HacsRepository:
+        """Create the full repository and replace the stub with it."""
+        if self.repository is None:
+            repository = self.repository_class(self.hacs, self.stub_data.full_name)
+            repository.data.id = self.entry
+            self.hacs.data.async_restore_repository_data(repository, self.repository_data)
+            # Nothing changed since the stub was listed
+            repository.data.revision = self.stub_data.revision
+            object.__setattr__(self, "repository", repository)
+            self.hacs.repositories.replace(self, repository)
+        return self.repository
+
+    def __getattr__(self, name: str) -> Any:
+        """Return an attribute of the created repository."""
+        return getattr(self.hydrate(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute on the created repository."""
+        setattr(self.hydrate(), name, value)
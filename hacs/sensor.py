@@ -3,20 +3,27 @@ from __future__ import annotations
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import callback
+from homeassistant.util import dt
 
-from .const import DOMAIN
+from .const import DOMAIN, HACS_SYSTEM_ID
 from .entity import HacsSystemEntity
 from .enums import ConfigurationType
 
 
 async def async_setup_platform(hass, _config, async_add_entities, _discovery_info=None):
     """Setup sensor platform."""
-    async_add_entities([HACSSensor(hacs=hass.data.get(DOMAIN))])
+    hacs = hass.data.get(DOMAIN)
+    async_add_entities(
+        [HACSSensor(hacs=hacs), HACSRateLimitSensor(hacs=hacs), HACSQueueLatencySensor(hacs=hacs)]
+    )
 
 
 async def async_setup_entry(hass, _config_entry, async_add_devices):
     """Setup sensor platform."""
-    async_add_devices([HACSSensor(hacs=hass.data.get(DOMAIN))])
+    hacs = hass.data.get(DOMAIN)
+    async_add_devices(
+        [HACSSensor(hacs=hacs), HACSRateLimitSensor(hacs=hacs), HACSQueueLatencySensor(hacs=hacs)]
+    )
 
 
 class HACSSensor(HacsSystemEntity, SensorEntity):
@@ -51,3 +58,40 @@ class HACSSensor(HacsSystemEntity, SensorEntity):
                     for repository in repositories
                 ]
             }
+
+
+class HACSRateLimitSensor(HacsSystemEntity, SensorEntity):
+    """HACS GitHub rate limit sensor class."""
+
+    _attr_name = "hacs rate limit"
+    _attr_unique_id = f"{HACS_SYSTEM_ID}_rate_limit"
+    _attr_native_unit_of_measurement = "requests"
+    _attr_native_value = None
+
+    @callback
+    def _update(self) -> None:
+        """Update the sensor."""
+        rate_limit = self.hacs.queue.rate_limit
+        self._attr_native_value = rate_limit.remaining
+        self._attr_extra_state_attributes = {
+            "limit": rate_limit.limit,
+            "reset": dt.utc_from_timestamp(rate_limit.reset).isoformat()
+            if rate_limit.reset
+            else None,
+            "background_tasks": rate_limit.tokens,
+        }
+
+
+class HACSQueueLatencySensor(HacsSystemEntity, SensorEntity):
+    """HACS queue latency sensor class."""
+
+    _attr_name = "hacs queue latency"
+    _attr_unique_id = f"{HACS_SYSTEM_ID}_queue_latency"
+    _attr_native_unit_of_measurement = "s"
+    _attr_native_value = None
+
+    @callback
+    def _update(self) -> None:
+        """Update the sensor."""
+        self._attr_native_value = round(self.hacs.queue.latency, 1)
+        self._attr_extra_state_attributes = {"pending_tasks": self.hacs.queue.pending_tasks}
@@ -7,7 +7,8 @@ from homeassistant.util import json as json_util
 
 from ..base import HacsBase
 from ..enums import HacsDispatchEvent, HacsGitHubRepo
-from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
+from ..repositories import RERPOSITORY_CLASSES
+from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository, RepositoryStub
 from .logger import get_hacs_logger
 from .path import is_safe
 from .store import async_load_from_store, async_save_to_store
@@ -57,6 +58,8 @@ class HacsData:
         self.logger = get_hacs_logger()
         self.hacs = hacs
         self.content = {}
+        # repository id -> repository manifest stored in content
+        self._stored_manifests = {}
 
     async def async_force_write(self, _=None):
         """Force write."""
@@ -84,12 +87,32 @@ class HacsData:
     async def _async_store_content_and_repos(self, _=None):  # bb: ignore
         """Store the main repos file and each repo that is out of date."""
         # Repositories
-        self.content = {}
+        changed = False
+        stored = set()
         for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
-                self.async_store_repository_data(repository)
-
-        await async_save_to_store(self.hacs.hass, "repositories", self.content)
+            if repository.data.category not in self.hacs.common.categories:
+                continue
+            repository_id = str(repository.data.id)
+            stored.add(repository_id)
+            if isinstance(repository, RepositoryStub):
+                # Not created since restore, the stored entry is still valid
+                continue
+            if (
+                not repository.data.__dict__.get("dirty", True)
+                and repository_id in self.content
+                and self._stored_manifests.get(repository_id) is repository.repository_manifest
+            ):
+                continue
+            previous = self.content.get(repository_id)
+            if self.async_store_repository_data(repository) != previous:
+                changed = True
+
+        for repository_id in set(self.content) - stored:
+            self.content.pop(repository_id)
+            self._stored_manifests.pop(repository_id, None)
+            changed = True
+
+        await async_save_to_store(self.hacs.hass, "repositories", dict(self.content), changed)
         for event in (HacsDispatchEvent.REPOSITORY, HacsDispatchEvent.CONFIG):
             self.hacs.async_dispatch(event, {})
 
@@ -111,7 +134,11 @@ class HacsData:
         if repository.data.last_fetched:
             data["last_fetched"] = repository.data.last_fetched.timestamp()
 
-        self.content[str(repository.data.id)] = data
+        repository_id = str(repository.data.id)
+        self.content[repository_id] = data
+        self._stored_manifests[repository_id] = repository.repository_manifest
+        repository.data.dirty = False
+        return data
 
     async def restore(self):
         """Restore saved data."""
@@ -127,6 +154,9 @@ class HacsData:
                 json_util.load_json,
                 f"{self.hacs.core.config_path}/custom_components/hacs/utils/default.repositories",
             )
+        else:
+            # Compare the next write with what is on disk
+            self.content = dict(repositories)
 
         self.logger.info("<HacsData restore> Restore started")
 
@@ -153,7 +183,14 @@ class HacsData:
                 self.hacs.common.ignored_repositories.append(entry)
 
         try:
-            await self.register_unknown_repositories(repositories)
+            stubs = {
+                entry: repo_data
+                for entry, repo_data in repositories.items()
+                if self.can_restore_as_stub(entry, repo_data)
+            }
+            await self.register_unknown_repositories(
+                {entry: repo_data for entry, repo_data in repositories.items() if entry not in stubs}
+            )
 
             for entry, repo_data in repositories.items():
                 if entry == "0":
@@ -162,6 +199,13 @@ class HacsData:
                         "<HacsData restore> Found repository with ID %s - %s", entry, repo_data
                     )
                     continue
+                if entry in stubs:
+                    self.hacs.repositories.register(
+                        RepositoryStub(
+                            self.hacs, RERPOSITORY_CLASSES[repo_data["category"]], entry, repo_data
+                        )
+                    )
+                    continue
                 self.async_restore_repository(entry, repo_data)
 
             self.logger.info("<HacsData restore> Restore done")
@@ -187,6 +231,21 @@ class HacsData:
         if register_tasks:
             await asyncio.gather(*register_tasks)
 
+    def can_restore_as_stub(self, entry, repository_data):
+        """Return True if the repository can be created on first access."""
+        full_name = repository_data.get("full_name")
+        return (
+            not self.hacs.status.new
+            and entry != "0"
+            and full_name is not None
+            and full_name != HacsGitHubRepo.INTEGRATION
+            and full_name not in self.hacs.common.skip
+            and full_name not in self.hacs.common.renamed_repositories
+            and repository_data.get("category") in RERPOSITORY_CLASSES
+            and not repository_data.get("installed", False)
+            and not self.hacs.repositories.is_registered(repository_id=entry)
+        )
+
     @callback
     def async_restore_repository(self, entry, repository_data):
         """Restore repository."""
@@ -194,8 +253,12 @@ class HacsData:
         if not (repository := self.hacs.repositories.get_by_full_name(full_name)):
             self.logger.error("<HacsData restore> Did not find %s (%s)", full_name, entry)
             return
-        # Restore repository attributes
         self.hacs.repositories.set_repository_id(repository, entry)
+        self.async_restore_repository_data(repository, repository_data)
+
+    @callback
+    def async_restore_repository_data(self, repository, repository_data):
+        """Restore repository attributes."""
         repository.data.authors = repository_data.get("authors", [])
         repository.data.description = repository_data.get("description", "")
         repository.data.downloads = repository_data.get("downloads", 0)
@@ -235,6 +298,6 @@ class HacsData:
         if repository.data.installed:
             repository.data.first_install = False
 
-        if full_name == HacsGitHubRepo.INTEGRATION:
+        if repository.data.full_name == HacsGitHubRepo.INTEGRATION:
             repository.data.installed_version = self.hacs.version
             repository.data.installed = True
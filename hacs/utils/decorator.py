@@ -6,6 +6,8 @@ from functools import wraps
 from typing import TYPE_CHECKING, Any, Coroutine
 
 from ..const import DEFAULT_CONCURRENT_BACKOFF_TIME, DEFAULT_CONCURRENT_TASKS
+from ..enums import QueuePriority
+from .queue_manager import QUEUE_PRIORITY
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -24,6 +26,13 @@ def concurrent(
         async def wrapper(*args, **kwargs) -> None:
             hacs: HacsBase = getattr(args[0], "hacs", None)
 
+            if QUEUE_PRIORITY.get() in (None, QueuePriority.USER):
+                # User actions skip the limit and hold back the background tasks
+                if hacs is None or hacs.queue is None:
+                    return await function(*args, **kwargs)
+                with hacs.queue.preempt():
+                    return await function(*args, **kwargs)
+
             async with max_concurrent:
                 result = await function(*args, **kwargs)
                 if (
@@ -0,0 +1,158 @@
+"""On disk cache for downloaded files."""
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from typing import Mapping
+
+from homeassistant.core import HomeAssistant, callback
+
+from .logger import get_hacs_logger
+from .store import get_store_for_key
+
+_LOGGER = get_hacs_logger()
+
+
+class DownloadCache:
+    """Cache of downloaded files, revalidated with conditional requests.
+
+    The body of each cached URL is a file in `directory`, the ETag and
+    Last-Modified values are kept in the hacs.download_cache store. The least
+    recently used files are removed when the cache grows above `max_size`.
+    """
+
+    max_file_size = 10 * 1024 * 1024
+    max_size = 100 * 1024 * 1024
+
+    def __init__(self, hass: HomeAssistant, directory: str) -> None:
+        self.hass = hass
+        self.directory = directory
+        self.store = get_store_for_key(hass, "download_cache")
+        self.entries: dict[str, dict] | None = None
+
+    async def async_load(self) -> None:
+        """Load the cache entries."""
+        if self.entries is None:
+            self.entries = await self.store.async_load() or {}
+
+    def file_path(self, url: str) -> str:
+        """Return the path of the cached body of url."""
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Return the headers to revalidate the cached body of url."""
+        if (entry := (self.entries or {}).get(url)) is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def async_read(self, url: str) -> bytes | None:
+        """Return the cached body of url."""
+
+        def _read():
+            try:
+                with open(self.file_path(url), "rb") as file_handler:
+                    return file_handler.read()
+            except OSError:
+                return None
+
+        if (content := await self.hass.async_add_executor_job(_read)) is None:
+            self.async_remove(url)
+            return None
+        if (entry := self.entries.get(url)) is not None:
+            entry["used"] = time.time()
+            self.save()
+        return content
+
+    async def async_copy(self, url: str, file_path: str) -> bool:
+        """Copy the cached body of url to file_path."""
+
+        def _copy():
+            try:
+                shutil.copyfile(self.file_path(url), file_path)
+                return True
+            except OSError:
+                return False
+
+        if not await self.hass.async_add_executor_job(_copy):
+            self.async_remove(url)
+            return False
+        if (entry := self.entries.get(url)) is not None:
+            entry["used"] = time.time()
+            self.save()
+        return True
+
+    async def async_store(self, url: str, headers: Mapping[str, str], source: bytes | str) -> None:
+        """Cache the body of a response, from its content or from a downloaded file."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if self.entries is None or (not etag and not last_modified):
+            return
+
+        def _write():
+            size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+            if size > self.max_file_size:
+                return None
+            os.makedirs(self.directory, exist_ok=True)
+            file_handler = tempfile.NamedTemporaryFile(dir=self.directory, delete=False)
+            try:
+                with file_handler:
+                    if isinstance(source, bytes):
+                        file_handler.write(source)
+                    else:
+                        with open(source, "rb") as source_handler:
+                            shutil.copyfileobj(source_handler, file_handler)
+                os.replace(file_handler.name, self.file_path(url))
+            except OSError:
+                os.remove(file_handler.name)
+                raise
+            return size
+
+        try:
+            size = await self.hass.async_add_executor_job(_write)
+        except OSError as exception:
+            _LOGGER.debug("<DownloadCache> Could not cache %s - %s", url, exception)
+            size = None
+        if size is None:
+            self.async_remove(url)
+            return
+
+        self.entries[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "size": size,
+            "used": time.time(),
+        }
+        total = sum(entry["size"] for entry in self.entries.values())
+        for cached_url, entry in sorted(self.entries.items(), key=lambda item: item[1]["used"]):
+            if total <= self.max_size:
+                break
+            total -= entry["size"]
+            self.async_remove(cached_url)
+        self.save()
+
+    @callback
+    def async_remove(self, url: str) -> None:
+        """Remove url from the cache."""
+        if self.entries is None or self.entries.pop(url, None) is None:
+            return
+
+        def _remove():
+            try:
+                os.remove(self.file_path(url))
+            except OSError:
+                pass
+
+        self.hass.async_add_executor_job(_remove)
+        self.save()
+
+    def save(self) -> None:
+        """Save the cache entries."""
+        self.store.async_delay_save(lambda: self.entries, 10)
@@ -2,24 +2,101 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+import heapq
+from itertools import count
+import math
 import time
-from typing import Coroutine
+from typing import Any, Coroutine, Iterator
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DEFAULT_CONCURRENT_TASKS
+from ..enums import QueuePriority
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import get_hacs_logger
 
 _LOGGER = get_hacs_logger()
 
+# Priority of the queued task running in this context, None outside of a queue
+QUEUE_PRIORITY: ContextVar[QueuePriority | None] = ContextVar("hacs_queue_priority", default=None)
+
+
+class RateLimitBucket:
+    """The number of queued tasks the GitHub rate limit allows.
+
+    Every task is counted as `requests_per_task` requests, and `reserve`
+    requests are kept for user actions. The bucket is refilled to the limit
+    when the rate limit resets, and the next reset is expected one `window`
+    later until a GitHub response tells otherwise.
+    """
+
+    requests_per_task = 10
+    reserve = 1000
+    window = 3600
+
+    def __init__(self) -> None:
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset: float = 0
+
+    def update(self, remaining: Any, reset: Any, limit: Any = None) -> None:
+        """Update the bucket with the rate limit from GitHub."""
+        self.remaining = int(remaining)
+        self.reset = float(reset)
+        if limit is not None:
+            self.limit = int(limit)
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Update the bucket with the rate limit headers of a GitHub response."""
+        remaining = getattr(headers, "x_ratelimit_remaining", None)
+        reset = getattr(headers, "x_ratelimit_reset", None)
+        if remaining is not None and reset is not None:
+            self.update(remaining, reset, getattr(headers, "x_ratelimit_limit", None))
+
+    def refill(self) -> None:
+        """Refill the bucket when the rate limit window has reset."""
+        if self.limit is None or (now := time.time()) < self.reset:
+            return
+        self.remaining = self.limit
+        self.reset += math.ceil((now - self.reset + 1) / self.window) * self.window
+
+    @property
+    def tokens(self) -> int:
+        """Return the number of tasks that can run."""
+        if self.remaining is None:
+            return 0
+        self.refill()
+        return max(0, math.floor((self.remaining - self.reserve) / self.requests_per_task))
+
+    def take(self) -> None:
+        """Count the requests of a started task."""
+        if self.remaining is not None:
+            self.refill()
+            self.remaining -= self.requests_per_task
+
 
 class QueueManager:
-    """The QueueManager class."""
+    """The QueueManager class.
+
+    Tasks run by priority with at most `max_concurrent` at once. Tasks above
+    user priority only start while the rate limit bucket has tokens and no
+    user action is running.
+    """
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, max_concurrent: int = DEFAULT_CONCURRENT_TASKS) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.queue: list[tuple[QueuePriority, int, float, Coroutine]] = []
         self.running = False
+        self.max_concurrent = max_concurrent
+        self.rate_limit = RateLimitBucket()
+        # Seconds the last started task waited in the queue
+        self.latency = 0.0
+        self._counter = count()
+        self._user_actions = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
 
     @property
     def pending_tasks(self) -> int:
@@ -33,11 +110,25 @@ class QueueManager:
 
     def clear(self) -> None:
         """Clear the queue."""
+        for *_, task in self.queue:
+            task.close()
         self.queue = []
 
-    def add(self, task: Coroutine) -> None:
+    def add(self, task: Coroutine, priority: QueuePriority = QueuePriority.USER) -> None:
         """Add a task to the queue."""
-        self.queue.append(task)
+        heapq.heappush(self.queue, (priority, next(self._counter), time.monotonic(), task))
+
+    @contextmanager
+    def preempt(self) -> Iterator[None]:
+        """Hold back queued tasks above user priority while a user action runs."""
+        self._user_actions += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._user_actions -= 1
+            if self._user_actions == 0:
+                self._idle.set()
 
     async def execute(self, number_of_tasks: int | None = None) -> None:
         """Execute the tasks in the queue."""
@@ -49,33 +140,45 @@ class QueueManager:
             return
 
         self.running = True
-
-        _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
-
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
-
-        for task in local_queue:
-            self.queue.remove(task)
-
-        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
+        started = 0
+
+        async def _worker() -> None:
+            nonlocal started
+            while self.queue and (number_of_tasks is None or started < number_of_tasks):
+                priority, _, queued, task = self.queue[0]
+                if priority > QueuePriority.USER:
+                    if self.rate_limit.tokens == 0:
+                        return
+                    if not self._idle.is_set():
+                        await self._idle.wait()
+                        # A user task may have been added meanwhile
+                        continue
+                    self.rate_limit.take()
+                heapq.heappop(self.queue)
+                started += 1
+                self.latency = time.monotonic() - queued
+                token = QUEUE_PRIORITY.set(priority)
+                try:
+                    await task
+                except Exception as exception:  # pylint: disable=broad-except
+                    _LOGGER.error("<QueueManager> %s", exception)
+                finally:
+                    QUEUE_PRIORITY.reset(token)
+
+        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(self.queue))
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
-        for entry in result:
-            if isinstance(entry, Exception):
-                _LOGGER.error("<QueueManager> %s", entry)
+        try:
+            await asyncio.gather(
+                *(_worker() for _ in range(min(self.max_concurrent, len(self.queue))))
+            )
+        finally:
+            self.running = False
         end = time.time() - start
 
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
-            len(local_queue),
+            started,
             end,
         )
         if self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
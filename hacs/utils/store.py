@@ -1,4 +1,6 @@
 """Storage handers."""
+from copy import deepcopy
+
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.util import json as json_util
@@ -9,6 +11,9 @@ from .logger import get_hacs_logger
 
 _LOGGER = get_hacs_logger()
 
+# Last content compared with or written to each store file, by path
+_SNAPSHOTS = {}
+
 
 class HACSStore(Store):
     """A subclass of Store that allows multiple loads in the executor."""
@@ -49,19 +54,28 @@ async def async_load_from_store(hass, key):
     return await get_store_for_key(hass, key).async_load() or {}
 
 
-async def async_save_to_store(hass, key, data):
+async def async_save_to_store(hass, key, data, changed=None):
     """Generate dynamic data to store and save it to the filesystem.
 
-    The data is only written if the content on the disk has changed
-    by reading the existing content and comparing it.
-
-    If the data has changed this will generate two executor jobs
+    The data is only written if the content has changed, by comparing it
+    with a snapshot of the last content written. The file on disk is only
+    read for the first comparison.
 
-    If the data has not changed this will generate one executor job
+    Callers that track changes themselves can pass `changed`, then the
+    comparison is skipped.
     """
-    current = await async_load_from_store(hass, key)
-    if current is None or current != data:
-        await get_store_for_key(hass, key).async_save(data)
+    store = get_store_for_key(hass, key)
+    if changed is None:
+        if store.path not in _SNAPSHOTS:
+            _SNAPSHOTS[store.path] = await async_load_from_store(hass, key)
+        changed = _SNAPSHOTS[store.path] != data
+        if changed:
+            _SNAPSHOTS[store.path] = deepcopy(data)
+    else:
+        _SNAPSHOTS.pop(store.path, None)
+
+    if changed:
+        await store.async_save(data)
         return
     _LOGGER.debug(
         "<HACSStore async_save_to_store> Did not store data for '%s'. Content did not change",
@@ -73,4 +87,6 @@ async def async_remove_store(hass, key):
     """Remove a store element that should no longer be used."""
     if "/" not in key:
         return
-    await get_store_for_key(hass, key).async_remove()
+    store = get_store_for_key(hass, key)
+    _SNAPSHOTS.pop(store.path, None)
+    await store.async_remove()
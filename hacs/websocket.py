@@ -15,6 +15,7 @@ from .base import HacsBase
 from .const import DOMAIN
 from .enums import HacsDispatchEvent
 from .exceptions import HacsException
+from .repositories.base import HacsRepository, RepositoryStub, next_revision
 from .utils import regex
 from .utils.store import async_load_from_store, async_save_to_store
 from .utils.version import version_left_higher_then_right
@@ -119,67 +120,117 @@ async def hacs_removed(hass, connection, msg):
     {
         vol.Required("type"): "hacs/repositories",
         vol.Optional("categories"): [str],
+        vol.Optional("installed"): bool,
+        vol.Optional("search"): cv.string,
+        vol.Optional("since"): vol.Coerce(int),
+        vol.Optional("offset"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
     }
 )
 @websocket_api.require_admin
 @websocket_api.async_response
 async def hacs_repositories(hass, connection, msg):
-    """Handle get media player cover command."""
+    """Handle get media player cover command.
+
+    Without since, offset or limit the full list is returned. With any of them
+    the result holds one page of the repositories that changed after the since
+    revision, the total number of matches, the ids of repositories removed
+    since then and the revision to pass as since on the next call.
+    """
     hacs: HacsBase = hass.data.get(DOMAIN)
+    revision = next_revision()
+    categories = msg.get("categories") or hacs.common.categories
+    search = msg.get("search", "").lower()
+    since = msg.get("since", 0)
+
+    repositories = [
+        repo
+        for repo in hacs.repositories.list_all
+        if repo.data.category in categories
+        and ("installed" not in msg or repo.data.installed == msg["installed"])
+        and search in repo.data.full_name_lower
+        and repo.data.revision > since
+        and not repo.ignored_by_country_configuration
+    ]
+
+    if not {"since", "offset", "limit"} & msg.keys():
+        connection.send_message(
+            websocket_api.result_message(
+                msg["id"], [_repository_json(hacs, repo) for repo in repositories]
+            )
+        )
+        return
+
+    offset = msg.get("offset", 0)
+    page = repositories[offset : offset + msg["limit"] if "limit" in msg else None]
     connection.send_message(
         websocket_api.result_message(
             msg["id"],
-            [
-                {
-                    "additional_info": repo.additional_info,
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "beta": repo.data.show_beta,
-                    "can_install": repo.can_download,
-                    "category": repo.data.category,
-                    "config_flow": repo.data.config_flow,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "default_branch": repo.data.default_branch,
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "first_install": repo.data.first_install,
-                    "full_name": repo.data.full_name,
-                    "hide_default_branch": repo.repository_manifest.hide_default_branch,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "info": None,
-                    "installed_version": repo.display_installed_version,
-                    "installed": repo.data.installed,
-                    "issues": repo.data.open_issues,
-                    "javascript_type": None,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "main_action": repo.main_action,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "releases": repo.data.published_tags,
-                    "selected_tag": repo.data.selected_tag,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status_description": repo.display_status_description,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                    "updated_info": repo.updated_info,
-                    "version_or_commit": repo.display_version_or_commit,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in (msg.get("categories") or hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-            ],
+            {
+                "revision": revision,
+                "total": len(repositories),
+                "repositories": [_repository_json(hacs, repo) for repo in page],
+                "removed": hacs.repositories.unregistered_since(since) if since else [],
+            },
         )
     )
 
 
+def _repository_json(hacs: HacsBase, repository: HacsRepository) -> dict:
+    """Return the listing of a repository, cached until the repository changes."""
+    if isinstance(repository, RepositoryStub):
+        repository = repository.hydrate()
+    if repository.json_cache is None or repository.json_cache[0] != repository.data.revision:
+        repository.json_cache = (
+            repository.data.revision,
+            {
+                "additional_info": repository.additional_info,
+                "authors": repository.data.authors,
+                "available_version": repository.display_available_version,
+                "beta": repository.data.show_beta,
+                "can_install": repository.can_download,
+                "category": repository.data.category,
+                "config_flow": repository.data.config_flow,
+                "country": repository.repository_manifest.country,
+                "default_branch": repository.data.default_branch,
+                "description": repository.data.description,
+                "domain": repository.data.domain,
+                "downloads": repository.data.downloads,
+                "file_name": repository.data.file_name,
+                "first_install": repository.data.first_install,
+                "full_name": repository.data.full_name,
+                "hide_default_branch": repository.repository_manifest.hide_default_branch,
+                "hide": repository.data.hide,
+                "homeassistant": repository.repository_manifest.homeassistant,
+                "id": repository.data.id,
+                "info": None,
+                "installed_version": repository.display_installed_version,
+                "installed": repository.data.installed,
+                "issues": repository.data.open_issues,
+                "javascript_type": None,
+                "last_updated": repository.data.last_updated,
+                "local_path": repository.content.path.local,
+                "main_action": repository.main_action,
+                "name": repository.display_name,
+                "new": repository.data.new,
+                "pending_upgrade": repository.pending_update,
+                "releases": repository.data.published_tags,
+                "selected_tag": repository.data.selected_tag,
+                "stars": repository.data.stargazers_count,
+                "state": repository.state,
+                "status_description": repository.display_status_description,
+                "status": repository.display_status,
+                "topics": repository.data.topics,
+                "updated_info": repository.updated_info,
+                "version_or_commit": repository.display_version_or_commit,
+            },
+        )
+    return {
+        **repository.json_cache[1],
+        "custom": not hacs.repositories.is_default(str(repository.data.id)),
+    }
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repository/data",
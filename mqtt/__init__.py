@@ -1,6 +1,6 @@
 """Support for MQTT message handling."""
 import asyncio
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
@@ -51,6 +51,7 @@ from .const import (
     CONF_QOS,
     CONF_RETAIN,
     CONF_STATE_TOPIC,
+    CONF_STATE_WRITE_INTERVAL,
     CONF_WILL_MESSAGE,
     DATA_MQTT_CONFIG,
     DEFAULT_BIRTH,
@@ -66,6 +67,7 @@ from .const import (
 )
 from .discovery import LAST_DISCOVERY
 from .models import Message, MessageCallbackType, PublishPayloadType
+from .topic_trie import SubscriptionTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -194,7 +196,13 @@ CONFIG_SCHEMA = vol.Schema(
     extra=vol.ALLOW_EXTRA,
 )
 
-SCHEMA_BASE = {vol.Optional(CONF_QOS, default=DEFAULT_QOS): _VALID_QOS_SCHEMA}
+SCHEMA_BASE = {
+    vol.Optional(CONF_QOS, default=DEFAULT_QOS): _VALID_QOS_SCHEMA,
+    # Collapse bursts of state updates into one state write per interval
+    vol.Optional(CONF_STATE_WRITE_INTERVAL): vol.All(
+        vol.Coerce(float), vol.Range(min=0)
+    ),
+}
 
 MQTT_BASE_PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(SCHEMA_BASE)
 
@@ -553,6 +561,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        self._subscription_trie = SubscriptionTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -748,7 +757,7 @@ class MQTT:
             topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
         )
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscription_trie.insert(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -761,7 +770,7 @@ class MQTT:
             if subscription not in self.subscriptions:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
+            self._subscription_trie.remove(subscription)
 
             if any(other.topic == topic for other in self.subscriptions):
                 # Other subscriptions on topic remaining - don't unsubscribe.
@@ -854,13 +863,8 @@ class MQTT:
         """Message received callback."""
         self.hass.add_job(self._mqtt_handle_message, msg)
 
-    @lru_cache(2048)
     def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        return self._subscription_trie.match(topic)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -873,14 +877,21 @@ class MQTT:
         timestamp = dt_util.utcnow()
 
         subscriptions = self._matching_subscriptions(msg.topic)
+        # Decoded payloads are shared by all subscribers of this message
+        payload_cache = {}
 
         for subscription in subscriptions:
 
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+                key = ("text", subscription.encoding)
+                if key not in payload_cache:
+                    try:
+                        payload_cache[key] = msg.payload.decode(subscription.encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        payload_cache[key] = None
+                payload = payload_cache[key]
+                if payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload[0:8192],
@@ -899,6 +910,7 @@ class MQTT:
                     msg.retain,
                     subscription.topic,
                     timestamp,
+                    payload_cache,
                 ),
             )
 
@@ -79,9 +79,11 @@ async def async_setup_platform(
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Set up MQTT binary sensor dynamically through MQTT discovery."""
     setup = functools.partial(
-        _async_setup_entity, hass, async_add_entities, config_entry=config_entry
+        _async_setup_entity, hass, config_entry=config_entry
+    )
+    await async_setup_entry_helper(
+        hass, binary_sensor.DOMAIN, setup, PLATFORM_SCHEMA, async_add_entities
     )
-    await async_setup_entry_helper(hass, binary_sensor.DOMAIN, setup, PLATFORM_SCHEMA)
 
 
 async def _async_setup_entity(
@@ -14,6 +14,7 @@ CONF_BIRTH_MESSAGE = "birth_message"
 CONF_QOS = ATTR_QOS
 CONF_RETAIN = ATTR_RETAIN
 CONF_STATE_TOPIC = "state_topic"
+CONF_STATE_WRITE_INTERVAL = "state_write_interval"
 CONF_WILL_MESSAGE = "will_message"
 
 DATA_MQTT_CONFIG = "mqtt_config"
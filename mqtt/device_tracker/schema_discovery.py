@@ -57,10 +57,14 @@ PLATFORM_SCHEMA_DISCOVERY = (
 async def async_setup_entry_from_discovery(hass, config_entry, async_add_entities):
     """Set up MQTT device tracker dynamically through MQTT discovery."""
     setup = functools.partial(
-        _async_setup_entity, hass, async_add_entities, config_entry=config_entry
+        _async_setup_entity, hass, config_entry=config_entry
     )
     await async_setup_entry_helper(
-        hass, device_tracker.DOMAIN, setup, PLATFORM_SCHEMA_DISCOVERY
+        hass,
+        device_tracker.DOMAIN,
+        setup,
+        PLATFORM_SCHEMA_DISCOVERY,
+        async_add_entities,
     )
 
 
@@ -8,6 +8,7 @@ import re
 import time
 
 from homeassistant.const import CONF_DEVICE, CONF_PLATFORM
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
@@ -61,6 +62,11 @@ MQTT_DISCOVERY_UPDATED = "mqtt_discovery_updated_{}"
 MQTT_DISCOVERY_NEW = "mqtt_discovery_new_{}_{}"
 MQTT_DISCOVERY_DONE = "mqtt_discovery_done_{}"
 LAST_DISCOVERY = "mqtt_last_discovery"
+DISCOVERY_QUEUE = "mqtt_discovery_queue"
+
+# Discovery messages are collected for this long and processed as one batch
+DISCOVERY_BATCH_DELAY = 0.2
+DISCOVERY_BATCH_SIZE = 200
 
 TOPIC_BASE = "~"
 
@@ -84,6 +90,28 @@ async def async_start(
 ) -> bool:
     """Start MQTT Discovery."""
     mqtt_integrations = {}
+    flush_handle = None
+
+    @callback
+    def async_schedule_flush():
+        """Process the queued discovery messages after a short delay."""
+        nonlocal flush_handle
+        if len(hass.data[DISCOVERY_QUEUE]) >= DISCOVERY_BATCH_SIZE:
+            async_flush()
+        elif flush_handle is None:
+            flush_handle = hass.loop.call_later(DISCOVERY_BATCH_DELAY, async_flush)
+
+    @callback
+    def async_flush():
+        """Hand the queued discovery messages over to a batch job."""
+        nonlocal flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        queue = hass.data[DISCOVERY_QUEUE]
+        if queue:
+            hass.data[DISCOVERY_QUEUE] = {}
+            hass.async_create_task(async_process_discovery_batch(queue))
 
     async def async_discovery_message_received(msg):
         """Process the received message."""
@@ -148,45 +176,125 @@ async def async_start(
 
             payload[CONF_PLATFORM] = "mqtt"
 
-        if discovery_hash in hass.data[PENDING_DISCOVERED]:
-            pending = hass.data[PENDING_DISCOVERED][discovery_hash]["pending"]
-            pending.appendleft(payload)
-            _LOGGER.info(
-                "Component has already been discovered: %s %s, queuing update",
-                component,
-                discovery_id,
-            )
-            return
+        # Only the latest message per discovery hash is kept in the queue
+        queue = hass.data[DISCOVERY_QUEUE]
+        queue.pop(discovery_hash, None)
+        queue[discovery_hash] = payload
+        async_schedule_flush()
+
+    async def async_process_discovery_batch(queue):
+        """Process a batch of discovery messages, de-duplicated by hash."""
+        start = time.monotonic()
+        new_payloads = {}
+        for discovery_hash, payload in queue.items():
+            component, discovery_id = discovery_hash
+            try:
+                if discovery_hash in hass.data[PENDING_DISCOVERED]:
+                    pending = hass.data[PENDING_DISCOVERED][discovery_hash]["pending"]
+                    pending.appendleft(payload)
+                    _LOGGER.info(
+                        "Component has already been discovered: %s %s, queuing update",
+                        component,
+                        discovery_id,
+                    )
+                elif discovery_hash not in hass.data[ALREADY_DISCOVERED] and payload:
+                    _LOGGER.debug("Process discovery payload %s", payload)
+                    _LOGGER.info("Found new component: %s %s", component, discovery_id)
+                    async_track_pending(component, discovery_id)
+                    hass.data[ALREADY_DISCOVERED][discovery_hash] = None
+                    new_payloads.setdefault(component, []).append(payload)
+                else:
+                    await async_process_discovery_payload(
+                        component, discovery_id, payload
+                    )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error processing discovery message for %s %s",
+                    component,
+                    discovery_id,
+                )
 
-        await async_process_discovery_payload(component, discovery_id, payload)
+        for component, payloads in new_payloads.items():
+            try:
+                await async_setup_component(component)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error setting up MQTT platform %s", component)
+                for payload in payloads:
+                    discovery_hash = payload.discovery_data[ATTR_DISCOVERY_HASH]
+                    hass.data[ALREADY_DISCOVERED].pop(discovery_hash, None)
+                    async_dispatcher_send(
+                        hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+                    )
+                continue
+            async_dispatcher_send(
+                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payloads
+            )
 
-    async def async_process_discovery_payload(component, discovery_id, payload):
+        hass.data[LAST_DISCOVERY] = time.time()
+        duration = time.monotonic() - start
+        _LOGGER.debug(
+            "Processed %s discovery messages in %.3f s (%.2f ms per config)",
+            len(queue),
+            duration,
+            duration * 1000 / len(queue),
+        )
 
-        _LOGGER.debug("Process discovery payload %s", payload)
+    @callback
+    def async_track_pending(component, discovery_id):
+        """Queue further updates for a component until its discovery is done."""
         discovery_hash = (component, discovery_id)
-        if discovery_hash in hass.data[ALREADY_DISCOVERED] or payload:
 
-            async def discovery_done(_):
-                pending = hass.data[PENDING_DISCOVERED][discovery_hash]["pending"]
-                _LOGGER.debug("Pending discovery for %s: %s", discovery_hash, pending)
-                if not pending:
-                    hass.data[PENDING_DISCOVERED][discovery_hash]["unsub"]()
-                    hass.data[PENDING_DISCOVERED].pop(discovery_hash)
+        async def discovery_done(_):
+            pending = hass.data[PENDING_DISCOVERED][discovery_hash]["pending"]
+            _LOGGER.debug("Pending discovery for %s: %s", discovery_hash, pending)
+            if not pending:
+                hass.data[PENDING_DISCOVERED][discovery_hash]["unsub"]()
+                hass.data[PENDING_DISCOVERED].pop(discovery_hash)
+            else:
+                payload = pending.pop()
+                await async_process_discovery_payload(
+                    component, discovery_id, payload
+                )
+
+        if discovery_hash not in hass.data[PENDING_DISCOVERED]:
+            hass.data[PENDING_DISCOVERED][discovery_hash] = {
+                "unsub": async_dispatcher_connect(
+                    hass,
+                    MQTT_DISCOVERY_DONE.format(discovery_hash),
+                    discovery_done,
+                ),
+                "pending": deque([]),
+            }
+
+    async def async_setup_component(component):
+        """Forward the config entry to the component platform once."""
+        config_entries_key = f"{component}.mqtt"
+        async with hass.data[DATA_CONFIG_ENTRY_LOCK]:
+            if config_entries_key not in hass.data[CONFIG_ENTRY_IS_SETUP]:
+                if component == "device_automation":
+                    # Local import to avoid circular dependencies
+                    # pylint: disable=import-outside-toplevel
+                    from . import device_automation
+
+                    await device_automation.async_setup_entry(hass, config_entry)
+                elif component == "tag":
+                    # Local import to avoid circular dependencies
+                    # pylint: disable=import-outside-toplevel
+                    from . import tag
+
+                    await tag.async_setup_entry(hass, config_entry)
                 else:
-                    payload = pending.pop()
-                    await async_process_discovery_payload(
-                        component, discovery_id, payload
+                    await hass.config_entries.async_forward_entry_setup(
+                        config_entry, component
                     )
+                hass.data[CONFIG_ENTRY_IS_SETUP].add(config_entries_key)
 
-            if discovery_hash not in hass.data[PENDING_DISCOVERED]:
-                hass.data[PENDING_DISCOVERED][discovery_hash] = {
-                    "unsub": async_dispatcher_connect(
-                        hass,
-                        MQTT_DISCOVERY_DONE.format(discovery_hash),
-                        discovery_done,
-                    ),
-                    "pending": deque([]),
-                }
+    async def async_process_discovery_payload(component, discovery_id, payload):
+
+        _LOGGER.debug("Process discovery payload %s", payload)
+        discovery_hash = (component, discovery_id)
+        if discovery_hash in hass.data[ALREADY_DISCOVERED] or payload:
+            async_track_pending(component, discovery_id)
 
         if discovery_hash in hass.data[ALREADY_DISCOVERED]:
             # Dispatch update
@@ -202,30 +310,9 @@ async def async_start(
             # Add component
             _LOGGER.info("Found new component: %s %s", component, discovery_id)
             hass.data[ALREADY_DISCOVERED][discovery_hash] = None
-
-            config_entries_key = f"{component}.mqtt"
-            async with hass.data[DATA_CONFIG_ENTRY_LOCK]:
-                if config_entries_key not in hass.data[CONFIG_ENTRY_IS_SETUP]:
-                    if component == "device_automation":
-                        # Local import to avoid circular dependencies
-                        # pylint: disable=import-outside-toplevel
-                        from . import device_automation
-
-                        await device_automation.async_setup_entry(hass, config_entry)
-                    elif component == "tag":
-                        # Local import to avoid circular dependencies
-                        # pylint: disable=import-outside-toplevel
-                        from . import tag
-
-                        await tag.async_setup_entry(hass, config_entry)
-                    else:
-                        await hass.config_entries.async_forward_entry_setup(
-                            config_entry, component
-                        )
-                    hass.data[CONFIG_ENTRY_IS_SETUP].add(config_entries_key)
-
+            await async_setup_component(component)
             async_dispatcher_send(
-                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), payload
+                hass, MQTT_DISCOVERY_NEW.format(component, "mqtt"), [payload]
             )
         else:
             # Unhandled discovery message
@@ -239,6 +326,7 @@ async def async_start(
 
     hass.data[ALREADY_DISCOVERED] = {}
     hass.data[PENDING_DISCOVERED] = {}
+    hass.data[DISCOVERY_QUEUE] = {}
 
     discovery_topics = [
         f"{discovery_topic}/+/+/config",
@@ -297,6 +385,7 @@ async def async_start(
 
 async def async_stop(hass: HomeAssistantType) -> bool:
     """Stop MQTT Discovery."""
+    hass.data[DISCOVERY_QUEUE] = {}
     if DISCOVERY_UNSUBSCRIBE in hass.data:
         for unsub in hass.data[DISCOVERY_UNSUBSCRIBE]:
             unsub()
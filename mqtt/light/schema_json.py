@@ -52,6 +52,7 @@ from ..mixins import (
     MQTT_JSON_ATTRS_SCHEMA,
     MqttEntity,
 )
+from ..models import message_json
 from .schema import MQTT_LIGHT_SCHEMA_SCHEMA
 from .schema_basic import CONF_BRIGHTNESS_SCALE
 
@@ -220,7 +221,7 @@ class MqttLightJson(MqttEntity, LightEntity, RestoreEntity):
         @log_messages(self.hass, self.entity_id)
         def state_received(msg):
             """Handle new MQTT messages."""
-            values = json.loads(msg.payload)
+            values = message_json(msg)
 
             if values["state"] == "ON":
                 self._state = True
@@ -1,5 +1,6 @@
 """MQTT component mixins and helpers."""
 from abc import abstractmethod
+import asyncio
 import json
 import logging
 from typing import Optional
@@ -22,6 +23,7 @@ from .const import (
     ATTR_DISCOVERY_PAYLOAD,
     ATTR_DISCOVERY_TOPIC,
     CONF_QOS,
+    CONF_STATE_WRITE_INTERVAL,
     DEFAULT_PAYLOAD_AVAILABLE,
     DEFAULT_PAYLOAD_NOT_AVAILABLE,
     DOMAIN,
@@ -36,7 +38,7 @@ from .discovery import (
     clear_discovery_hash,
     set_discovery_hash,
 )
-from .models import Message
+from .models import Message, message_json
 from .subscription import async_subscribe_topics, async_unsubscribe_topics
 from .util import valid_subscribe_topic
 
@@ -142,22 +144,71 @@ MQTT_JSON_ATTRS_SCHEMA = vol.Schema(
 )
 
 
-async def async_setup_entry_helper(hass, domain, async_setup, schema):
-    """Set up entity, automation or tag creation dynamically through MQTT discovery."""
+async def async_setup_entry_helper(
+    hass, domain, async_setup, schema, async_add_entities=None
+):
+    """Set up entity, automation or tag creation dynamically through MQTT discovery.
+
+    Entity platforms pass their async_add_entities, async_setup then gets the
+    function to add its entities with as first argument, and the entities of
+    a discovery batch are added with one call.
+    """
 
-    async def async_discover(discovery_payload):
-        """Discover and add an MQTT entity, automation or tag."""
-        discovery_data = discovery_payload.discovery_data
+    async def async_setup_discovered(config, discovery_data, *args):
+        """Set up one validated MQTT entity, automation or tag."""
         try:
-            config = schema(discovery_payload)
-            await async_setup(config, discovery_data=discovery_data)
-        except Exception:
-            discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
-            clear_discovery_hash(hass, discovery_hash)
-            async_dispatcher_send(
-                hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None
+            await async_setup(*args, config, discovery_data=discovery_data)
+        except Exception:  # pylint: disable=broad-except
+            async_discovery_failed(discovery_data)
+            _LOGGER.exception(
+                "Error setting up discovered %s %s",
+                domain,
+                discovery_data[ATTR_DISCOVERY_HASH],
+            )
+            return False
+        return True
+
+    @callback
+    def async_discovery_failed(discovery_data):
+        """Forget the discovery hash so the item can be discovered again."""
+        discovery_hash = discovery_data[ATTR_DISCOVERY_HASH]
+        clear_discovery_hash(hass, discovery_hash)
+        async_dispatcher_send(hass, MQTT_DISCOVERY_DONE.format(discovery_hash), None)
+
+    async def async_discover(discovery_payloads):
+        """Discover and add a batch of MQTT entities, automations or tags."""
+        configs = []
+        for discovery_payload in discovery_payloads:
+            discovery_data = discovery_payload.discovery_data
+            try:
+                configs.append((schema(discovery_payload), discovery_data))
+            except Exception as err:  # pylint: disable=broad-except
+                async_discovery_failed(discovery_data)
+                _LOGGER.error(
+                    "Invalid discovery config for %s %s: %s",
+                    domain,
+                    discovery_data[ATTR_DISCOVERY_HASH],
+                    err,
+                )
+
+        if async_add_entities is None:
+            await asyncio.gather(
+                *(
+                    async_setup_discovered(config, discovery_data)
+                    for config, discovery_data in configs
+                )
             )
-            raise
+            return
+
+        entities = []
+        for config, discovery_data in configs:
+            new_entities = []
+            if await async_setup_discovered(
+                config, discovery_data, new_entities.extend
+            ):
+                entities.extend(new_entities)
+        if entities:
+            async_add_entities(entities)
 
     async_dispatcher_connect(
         hass, MQTT_DISCOVERY_NEW.format(domain, "mqtt"), async_discover
@@ -196,7 +247,9 @@ class MqttAttributes(Entity):
                 payload = msg.payload
                 if attr_tpl is not None:
                     payload = attr_tpl.async_render_with_possible_json_value(payload)
-                json_dict = json.loads(payload)
+                    json_dict = json.loads(payload)
+                else:
+                    json_dict = message_json(msg)
                 if isinstance(json_dict, dict):
                     self._attributes = json_dict
                     self.async_write_ha_state()
@@ -529,6 +582,9 @@ class MqttEntity(
         self.hass = hass
         self._unique_id = config.get(CONF_UNIQUE_ID)
         self._sub_state = None
+        self._state_write_interval = config.get(CONF_STATE_WRITE_INTERVAL)
+        self._state_write_last = 0.0
+        self._state_write_timer = None
 
         # Load config
         self._setup_from_config(config)
@@ -547,6 +603,7 @@ class MqttEntity(
     async def discovery_update(self, discovery_payload):
         """Handle updated discovery message."""
         config = self.config_schema()(discovery_payload)
+        self._state_write_interval = config.get(CONF_STATE_WRITE_INTERVAL)
         self._setup_from_config(config)
         await self.attributes_discovery_update(config)
         await self.availability_discovery_update(config)
@@ -554,8 +611,40 @@ class MqttEntity(
         await self._subscribe_topics()
         self.async_write_ha_state()
 
+    @callback
+    def async_write_ha_state(self):
+        """Write the state, at most once per state_write_interval if set.
+
+        Updates received while a write is pending are dropped, the pending
+        write picks up the latest value when it fires.
+        """
+        if not self._state_write_interval:
+            super().async_write_ha_state()
+            return
+        if self._state_write_timer is not None:
+            return
+        now = self.hass.loop.time()
+        delay = self._state_write_last + self._state_write_interval - now
+        if delay <= 0:
+            self._state_write_last = now
+            super().async_write_ha_state()
+            return
+        self._state_write_timer = self.hass.loop.call_later(
+            delay, self._async_write_pending_state
+        )
+
+    @callback
+    def _async_write_pending_state(self):
+        """Write the state collected during the coalescing window."""
+        self._state_write_timer = None
+        self._state_write_last = self.hass.loop.time()
+        super().async_write_ha_state()
+
     async def async_will_remove_from_hass(self):
         """Unsubscribe when removed."""
+        if self._state_write_timer is not None:
+            self._state_write_timer.cancel()
+            self._state_write_timer = None
         self._sub_state = await subscription.async_unsubscribe_topics(
             self.hass, self._sub_state
         )
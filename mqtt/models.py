@@ -1,6 +1,7 @@
 """Modesl used by multiple MQTT modules."""
 import datetime as dt
-from typing import Callable, Optional, Union
+import json
+from typing import Any, Callable, Optional, Union
 
 import attr
 
@@ -17,6 +18,28 @@ class Message:
     retain: bool = attr.ib()
     subscribed_topic: Optional[str] = attr.ib(default=None)
     timestamp: Optional[dt.datetime] = attr.ib(default=None)
+    payload_cache: Optional[dict] = attr.ib(default=None, eq=False, repr=False)
 
 
 MessageCallbackType = Callable[[Message], None]
+
+
+def message_json(msg: Message) -> Any:
+    """Return the payload parsed as JSON.
+
+    The result is shared between all subscribers of the same message, so it
+    must not be mutated. Raises ValueError if the payload is not valid JSON.
+    """
+    cache = msg.payload_cache
+    if cache is None:
+        return json.loads(msg.payload)
+    key = ("json", msg.payload)
+    if key not in cache:
+        try:
+            cache[key] = json.loads(msg.payload)
+        except ValueError as err:
+            cache[key] = err
+    result = cache[key]
+    if isinstance(result, ValueError):
+        raise ValueError(str(result))
+    return result
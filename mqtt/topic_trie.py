@@ -0,0 +1,122 @@
+"""Topic trie used to match incoming MQTT messages to subscriptions."""
+from itertools import count
+from typing import Any, Dict, List, Optional
+
+MATCH_CACHE_SIZE = 2048
+
+
+class _TrieNode:
+    """Node holding the subscriptions for one topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.subscriptions: List[Any] = []
+
+
+class SubscriptionTrie:
+    """Match topics against subscriptions with + and # wildcards.
+
+    Subscriptions are stored by topic level, so matching a topic costs
+    O(levels) instead of O(subscriptions). Match results are cached per topic
+    and the cache is patched on insert and remove instead of being cleared.
+    """
+
+    def __init__(self, cache_size: int = MATCH_CACHE_SIZE) -> None:
+        """Initialize the trie."""
+        self._root = _TrieNode()
+        self._order: Dict[int, int] = {}
+        self._counter = count()
+        self._cache: Dict[str, List[Any]] = {}
+        self._cache_size = cache_size
+
+    def insert(self, subscription: Any) -> None:
+        """Add a subscription, any object with a topic attribute."""
+        levels = subscription.topic.split("/")
+        node = self._root
+        for level in levels:
+            node = node.children.setdefault(level, _TrieNode())
+        node.subscriptions.append(subscription)
+        self._order[id(subscription)] = next(self._counter)
+        # Cached lists are replaced, not mutated, as they may be iterated
+        for topic, matches in self._cache.items():
+            if _filter_matches(levels, topic):
+                self._cache[topic] = [*matches, subscription]
+
+    def remove(self, subscription: Any) -> None:
+        """Remove a subscription and prune empty nodes."""
+        path = []
+        node: Optional[_TrieNode] = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children.get(level)
+            if node is None:
+                return
+        node.subscriptions = [
+            sub for sub in node.subscriptions if sub is not subscription
+        ]
+        self._order.pop(id(subscription), None)
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+        for topic, matches in self._cache.items():
+            if any(sub is subscription for sub in matches):
+                self._cache[topic] = [sub for sub in matches if sub is not subscription]
+
+    def match(self, topic: str) -> List[Any]:
+        """Return the subscriptions matching a topic, in insertion order."""
+        matches = self._cache.get(topic)
+        if matches is not None:
+            return matches
+        matches = []
+        levels = topic.split("/")
+        # Wildcards at the first level don't match topics starting with $
+        self._match(self._root, levels, 0, not topic.startswith("$"), matches)
+        if len(matches) > 1:
+            order = self._order
+            matches.sort(key=lambda sub: order[id(sub)])
+        if len(self._cache) >= self._cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[topic] = matches
+        return matches
+
+    def _match(
+        self,
+        node: _TrieNode,
+        levels: List[str],
+        index: int,
+        wildcards: bool,
+        matches: List[Any],
+    ) -> None:
+        """Collect matching subscriptions below node."""
+        if wildcards:
+            multi = node.children.get("#")
+            if multi is not None:
+                matches.extend(multi.subscriptions)
+        if index == len(levels):
+            matches.extend(node.subscriptions)
+            return
+        child = node.children.get(levels[index])
+        if child is not None:
+            self._match(child, levels, index + 1, True, matches)
+        if wildcards:
+            single = node.children.get("+")
+            if single is not None:
+                self._match(single, levels, index + 1, True, matches)
+
+
+def _filter_matches(levels: List[str], topic: str) -> bool:
+    """Return True if the split subscription filter matches the topic."""
+    if topic.startswith("$") and levels[0] in ("+", "#"):
+        return False
+    parts = topic.split("/")
+    for index, level in enumerate(levels):
+        if level == "#":
+            return True
+        if index >= len(parts) or (level not in ("+", parts[index])):
+            return False
+    return len(levels) == len(parts)
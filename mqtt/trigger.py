@@ -1,5 +1,4 @@
 """Offer MQTT listening automation rules."""
-import json
 import logging
 
 import voluptuous as vol
@@ -9,6 +8,7 @@ from homeassistant.core import HassJob, callback
 from homeassistant.helpers import config_validation as cv, template
 
 from .. import mqtt
+from .models import message_json
 
 # mypy: allow-untyped-defs
 
@@ -80,7 +80,7 @@ async def async_attach_trigger(hass, config, action, automation_info):
             }
 
             try:
-                data["payload_json"] = json.loads(mqttmsg.payload)
+                data["payload_json"] = message_json(mqttmsg)
             except ValueError:
                 pass
 
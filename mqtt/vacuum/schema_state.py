@@ -40,6 +40,7 @@ from ..mixins import (
     MQTT_JSON_ATTRS_SCHEMA,
     MqttEntity,
 )
+from ..models import message_json
 from .schema import MQTT_VACUUM_SCHEMA, services_to_strings, strings_to_services
 
 SERVICE_TO_STRING = {
@@ -202,7 +203,7 @@ class MqttStateVacuum(MqttEntity, StateVacuumEntity):
         @log_messages(self.hass, self.entity_id)
         def state_message_received(msg):
             """Handle state MQTT message."""
-            payload = json.loads(msg.payload)
+            payload = dict(message_json(msg))
             if STATE in payload and payload[STATE] in POSSIBLE_STATES:
                 self._state = POSSIBLE_STATES[payload[STATE]]
                 del payload[STATE]
@@ -20,10 +20,13 @@ from .core import logger, utils
 from .core.const import DOMAIN, TITLE
 from .core.entity import XEntity
 from .core.gateway import XGateway
+from .core.gateway.base import SIGNAL_MIOT_PROPERTIES
 from .core.xiaomi_cloud import MiCloud
 
 _LOGGER = logging.getLogger(__name__)
 
+MIOT_DOMAIN = "xiaomi_miot"
+
 DOMAINS = [
     'alarm_control_panel', 'binary_sensor', 'climate', 'cover', 'light',
     'number', 'select', 'sensor', 'switch'
@@ -95,7 +98,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     if not entry.update_listeners:
         entry.add_update_listener(async_update_options)
 
-    hass.data[DOMAIN][entry.entry_id] = XGateway(**entry.options)
+    gw = XGateway(**entry.options)
+    hass.data[DOMAIN][entry.entry_id] = gw
+
+    async def miot_properties(data: list):
+        # pass pushed properties to the Xiaomi Miot Auto integration
+        if MIOT_DOMAIN in hass.data:
+            hass.bus.async_fire(f"{MIOT_DOMAIN}.properties_changed", {"params": data})
+
+    gw.dispatcher_connect(SIGNAL_MIOT_PROPERTIES, miot_properties)
 
     hass.async_create_task(_setup_domains(hass, entry))
 
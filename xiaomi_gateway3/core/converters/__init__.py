@@ -33,42 +33,68 @@ def is_mihome_zigbee(model: str) -> bool:
     return model.startswith(("lumi.", "ikea."))
 
 
+# model and default type -> position in DEVICES, and parsed ttl per position,
+# built on first use so external converters are already loaded
+DEVICES_INDEX: Optional[dict] = None
+
+
+def get_devices_index() -> dict:
+    global DEVICES_INDEX
+    if DEVICES_INDEX is None or DEVICES_INDEX["size"] != len(DEVICES):
+        models, defaults, ttls = {}, {}, []
+        for i, desc in enumerate(DEVICES):
+            for key in desc:
+                models.setdefault(key, i)
+            if "default" in desc:
+                defaults.setdefault(desc["default"], i)
+            ttl = desc.get("ttl")
+            ttls.append(parse_time(ttl) if isinstance(ttl, str) else ttl)
+        DEVICES_INDEX = {
+            "size": len(DEVICES), "models": models, "defaults": defaults,
+            "ttls": ttls
+        }
+    return DEVICES_INDEX
+
+
 def get_device_info(model: str, type: str) -> Optional[XDeviceInfo]:
     """Type is used to select the default spec if the model didn't match
     earlier. Should be the latest spec in the list.
     """
-    for desc in DEVICES:
-        if model not in desc and desc.get("default") != type:
-            continue
-        info = desc.get(model) or ["Unknown", type.upper(), None]
-        brand, name, market = info if len(info) == 3 else info + [None]
-
-        if type == ZIGBEE and not is_mihome_zigbee(model):
-            url = "https://www.zigbee2mqtt.io/supported-devices/#s=" + market \
-                if market else None
-        else:
-            url = f"https://home.miot-spec.com/s/{model}"
-
-        if market and type == ZIGBEE:
-            market = f"{type} {market} ({model})"
-        elif market:
-            market = f"{type} {market}"
-        else:
-            market = f"{type} ({model})"
-
-        ttl = desc.get("ttl")
-        if isinstance(ttl, str):
-            ttl = parse_time(ttl)
-
-        return XDeviceInfo(
-            manufacturer=brand,
-            model=market,
-            name=f"{brand} {name}",
-            url=url,
-            spec=desc["spec"],
-            ttl=ttl
-        )
-    raise RuntimeError
+    index = get_devices_index()
+    # same result as the first spec in the list with model or default type
+    i = min(
+        (i for i in (index["models"].get(model), index["defaults"].get(type))
+         if i is not None),
+        default=None
+    )
+    if i is None:
+        raise RuntimeError
+
+    desc = DEVICES[i]
+    info = desc.get(model) or ["Unknown", type.upper(), None]
+    brand, name, market = info if len(info) == 3 else info + [None]
+
+    if type == ZIGBEE and not is_mihome_zigbee(model):
+        url = "https://www.zigbee2mqtt.io/supported-devices/#s=" + market \
+            if market else None
+    else:
+        url = f"https://home.miot-spec.com/s/{model}"
+
+    if market and type == ZIGBEE:
+        market = f"{type} {market} ({model})"
+    elif market:
+        market = f"{type} {market}"
+    else:
+        market = f"{type} ({model})"
+
+    return XDeviceInfo(
+        manufacturer=brand,
+        model=market,
+        name=f"{brand} {name}",
+        url=url,
+        spec=desc["spec"],
+        ttl=index["ttls"][i]
+    )
 
 
 RE_INFO_MODEL = re.compile(r"^(zigbee|ble|mesh)(?: ([^ ]+))?(?: \((.+?)\))?$")
@@ -72,13 +72,21 @@ class GatewayStatsConverter(Converter):
         "network_pan_id", "radio_tx_power", "radio_channel",
         "free_mem", "load_avg", "rssi", "uptime",
         "bluetooth_tx", "bluetooth_rx", "bluetooth_oe",
-        "zigbee_tx", "zigbee_rx", "zigbee_oe"
+        "zigbee_tx", "zigbee_rx", "zigbee_oe", "mqtt_queue", "mqtt_lag",
+        "miio_rtt"
     }
 
     def decode(self, device: 'XDevice', payload: dict, value: dict):
         if self.attr in value:
             payload[self.attr] = value[self.attr]
 
+        if 'mqtt_queue' in value:
+            # messages waiting for workers, max wait time since last timer
+            # and smoothed miio round trip time
+            payload['mqtt_queue'] = value['mqtt_queue']
+            payload['mqtt_lag'] = value['mqtt_lag']
+            payload['miio_rtt'] = value.get('miio_rtt')
+
         if 'networkUp' in value:
             payload.update({
                 'network_pan_id': value.get('networkPanId'),
@@ -20,6 +20,7 @@ RE_DID = re.compile(r"^lumi.[1-9a-f][0-9a-f]{,15}$")
 RE_ZIGBEE_MAC = re.compile(r"^0x[0-9a-f]{16}$")
 RE_NETWORK_MAC = re.compile(r"^[0-9a-f]{12}$")
 RE_NWK = re.compile(r"^0x[0-9a-z]{4}$")
+RE_MIOT = re.compile(r"^(\d+)\.([pe])\.(\d+)$")
 
 BATTERY_AVAILABLE = 3 * 60 * 60  # 3 hours
 POWER_AVAILABLE = 20 * 60  # 20 minutes
@@ -40,6 +41,10 @@ LEGACY_ATTR_ID = {
 
 class XDevice:
     converters: List[Converter] = None
+    # converters indexes, rebuilt by index_converters
+    convs_by_attr: Dict[str, List[Converter]] = {}
+    convs_by_mi: Dict[Union[str, tuple], List[Converter]] = {}
+    convs_by_zigbee: Dict[str, List[Converter]] = {}
 
     available_timeout: float = 0
     poll_timeout: float = 0
@@ -142,9 +147,7 @@ class XDevice:
 
     @property
     def has_zigbee_conv(self) -> bool:
-        if not self.converters:
-            return False
-        return any(True for conv in self.converters if conv.zigbee)
+        return bool(self.convs_by_zigbee)
 
     def has_support(self, feature: str) -> bool:
         if feature == "zigbee":
@@ -276,6 +279,7 @@ class XDevice:
         """
         if entities is None:
             self.converters = self.info.spec
+            self.index_converters()
             return
 
         self.converters = self.info.spec.copy()
@@ -291,6 +295,29 @@ class XDevice:
                     conv = Converter(attr, domain)
                     self.converters.append(conv)
 
+        self.index_converters()
+
+    def index_converters(self):
+        """Index converters by attr, MIoT/Lumi prop and Zigbee cluster, so
+        decode and encode don't need to scan the whole converters list.
+        Should be called after any change to the converters list.
+        """
+        by_attr = {}
+        by_mi = {}
+        by_zigbee = {}
+        for conv in self.converters or []:
+            by_attr.setdefault(conv.attr, []).append(conv)
+            if conv.mi:
+                by_mi.setdefault(conv.mi, []).append(conv)
+                if m := RE_MIOT.match(conv.mi):
+                    key = (int(m[1]), m[2], int(m[3]))
+                    by_mi.setdefault(key, []).append(conv)
+            if conv.zigbee:
+                by_zigbee.setdefault(conv.zigbee, []).append(conv)
+        self.convs_by_attr = by_attr
+        self.convs_by_mi = by_mi
+        self.convs_by_zigbee = by_zigbee
+
     def setup_available(self):
         # TODO: change to better logic?
         if self.type == GATEWAY or self.model == MESH_GROUP_MODEL:
@@ -298,7 +325,7 @@ class XDevice:
             return
 
         # TODO: change to better logic?
-        if any(True for c in self.converters if c.attr == "battery"):
+        if "battery" in self.convs_by_attr:
             self.available_timeout = self.info.ttl or BATTERY_AVAILABLE
         else:
             self.available_timeout = self.info.ttl or POWER_AVAILABLE
@@ -309,15 +336,16 @@ class XDevice:
 
     def decode(self, attr_name: str, value: Any) -> Optional[dict]:
         """Find converter by attr_name and decode value."""
-        for conv in self.converters:
-            if conv.attr == attr_name:
-                self.available = True
-                self.decode_ts = time.time()
+        convs = self.convs_by_attr.get(attr_name)
+        if not convs:
+            return None
 
-                payload = {}
-                conv.decode(self, payload, value)
-                return payload
-        return None
+        self.available = True
+        self.decode_ts = time.time()
+
+        payload = {}
+        convs[0].decode(self, payload, value)
+        return payload
 
     def decode_lumi(self, value: list) -> dict:
         """Decode value from Zigbee Lumi/MIoT spec."""
@@ -341,18 +369,17 @@ class XDevice:
 
             # piid or eiid is MIoT format
             elif "piid" in param:
-                prop = f"{param['siid']}.p.{param['piid']}"
+                prop = (param["siid"], "p", param["piid"])
             elif "eiid" in param:
-                prop = f"{param['siid']}.e.{param['eiid']}"
+                prop = (param["siid"], "e", param["eiid"])
             else:
                 raise RuntimeError
 
             self.available = True
             self.decode_ts = time.time()
 
-            for conv in self.converters:
-                if conv.mi == prop:
-                    conv.decode(self, payload, v)
+            for conv in self.convs_by_mi.get(prop, ()):
+                conv.decode(self, payload, v)
 
         return payload
 
@@ -369,9 +396,8 @@ class XDevice:
         self.decode_ts = time.time()
 
         payload = {}
-        for conv in self.converters:
-            if conv.zigbee == value["cluster"]:
-                conv.decode(self, payload, value)
+        for conv in self.convs_by_zigbee.get(value["cluster"], ()):
+            conv.decode(self, payload, value)
         return payload
 
     def encode(self, value: dict) -> dict:
@@ -384,16 +410,15 @@ class XDevice:
         self.encode_ts = time.time()
         payload = {}
         for k, v in value.items():
-            for conv in self.converters:
-                if conv.attr == k:
-                    conv.encode(self, payload, v)
+            for conv in self.convs_by_attr.get(k, ()):
+                conv.encode(self, payload, v)
         return payload
 
     def encode_read(self, attrs: set) -> dict:
         self.encode_ts = time.time()
         payload = {}
-        for conv in self.converters:
-            if conv.attr in attrs:
+        for attr in attrs:
+            for conv in self.convs_by_attr.get(attr, ()):
                 conv.read(self, payload)
         return payload
 
@@ -411,7 +436,7 @@ class XDevice:
         if self.lazy_setup:
             for attr in self.lazy_setup & attrs:
                 self.lazy_setup.remove(attr)
-                conv = next(c for c in self.converters if c.attr == attr)
+                conv = self.convs_by_attr[attr][0]
                 gateway = self.gateways[0]
                 gateway.setups[conv.domain](gateway, self, conv)
 
@@ -23,17 +23,27 @@ from .base import SIGNAL_PREPARE_GW, SIGNAL_MQTT_CON, SIGNAL_MQTT_DIS, \
 from .gate_e1 import GateE1
 from .gate_gw3 import GateGW3
 from .. import shell
-from ..converters import GATEWAY
+from ..converters import GATEWAY, BLE
+from ..device import XDevice
 from ..mini_miio import AsyncMiIO
 from ..mini_mqtt import MiniMQTT, MQTTMessage
 
 _LOGGER = logging.getLogger(__name__)
 
+# messages are processed by a fixed pool of workers, partitioned by device
+# so each device's messages are handled in order
+MQTT_WORKERS = 8
+MQTT_QUEUE_SIZE = 256
+# max gateways preparing over telnet at the same time
+PREPARE_PARALLEL = 4
+
 
 class XGateway(GateGW3, GateE1):
     main_task: asyncio.Task = None
     timer_task: asyncio.Task = None
 
+    prepare_semaphore: asyncio.Semaphore = None
+
     def __init__(self, host: str, token: str, **options):
         self.log = _LOGGER
 
@@ -44,6 +54,13 @@ class XGateway(GateGW3, GateE1):
         self.setups = {}
         self.tasks = []
 
+        self.mqtt_queues = []
+        self.mqtt_lag = 0
+
+        # startup phases durations in seconds, for diagnostics
+        self.timings = {}
+        self.start_ts = None
+
         self.miio = AsyncMiIO(host, token)
         self.mqtt = MiniMQTT()
 
@@ -54,14 +71,45 @@ class XGateway(GateGW3, GateE1):
         return self.options.get('telnet_cmd')
 
     def start(self):
+        self.start_ts = time.monotonic()
+        self.restore_devices()
         self.main_task = asyncio.create_task(self.run_forever())
 
+    def restore_devices(self):
+        """Setup devices known from the last run before the gateway is
+        connected, so their entities don't wait for telnet.
+        """
+        t = time.monotonic()
+        items = self.restore.pop(self.host, [])
+        for mac, type, model, did, nwk, fw_ver in items:
+            key = mac if type == BLE else did
+            device = self.devices.get(key)
+            if not device:
+                try:
+                    device = XDevice(type, model, did, mac, nwk)
+                except Exception as e:
+                    self.debug(f"Can't restore device {did}", exc_info=e)
+                    continue
+                if fw_ver:
+                    device.extra["fw_ver"] = fw_ver
+            self.add_device(key, device)
+            device.extra["restored"] = self.host
+        self.timings["restore"] = round(time.monotonic() - t, 3)
+        self.timings["restored_devices"] = len(items)
+
     # noinspection PyUnusedLocal
     async def stop(self, *args):
         self.debug("Stop all tasks")
 
         self.main_task.cancel()
 
+        for task in self.tasks:
+            task.cancel()
+        self.tasks.clear()
+        self.mqtt_queues.clear()
+
+        self.miio.close()
+
         for device in self.devices.values():
             if self in device.gateways:
                 device.gateways.remove(self)
@@ -81,29 +129,83 @@ class XGateway(GateGW3, GateE1):
             return False
         return True
 
+    def mqtt_start_workers(self):
+        if self.mqtt_queues:
+            return
+        for _ in range(MQTT_WORKERS):
+            queue = asyncio.Queue(MQTT_QUEUE_SIZE)
+            self.mqtt_queues.append(queue)
+            self.tasks.append(asyncio.create_task(self.mqtt_worker(queue)))
+
+    async def mqtt_worker(self, queue: asyncio.Queue):
+        while True:
+            ts, msg = await queue.get()
+            lag = time.time() - ts
+            if lag > self.mqtt_lag:
+                self.mqtt_lag = lag
+            await self.mqtt_message(msg)
+
+    async def mqtt_dispatch(self, msg: MQTTMessage):
+        """Put message to the worker queue of its device. Waits if the queue
+        is full, so a burst slows down reading instead of piling up tasks.
+        """
+        i = msg.payload.find(b'"did":"')
+        if i >= 0:
+            i += 7
+            key = msg.payload[i:msg.payload.find(b'"', i)]
+        else:
+            key = msg.topic
+        queue = self.mqtt_queues[hash(key) % len(self.mqtt_queues)]
+        await queue.put((time.time(), msg))
+
+    def mqtt_stats(self) -> dict:
+        stats = {
+            'mqtt_queue': sum(q.qsize() for q in self.mqtt_queues),
+            'mqtt_lag': round(self.mqtt_lag, 3),
+            'miio_rtt': round(self.miio.rtt, 3) if self.miio.rtt else None,
+        }
+        self.mqtt_lag = 0
+        return stats
+
     async def run_forever(self):
         self.debug("Start main loop")
 
+        self.mqtt_start_workers()
+
+        if XGateway.prepare_semaphore is None:
+            XGateway.prepare_semaphore = asyncio.Semaphore(PREPARE_PARALLEL)
+
         """Main thread loop."""
         while True:
             try:
                 # if not telnet - enable it
+                t = time.monotonic()
                 if not await self.check_port(23) and \
                         not await self.enable_telnet():
                     await asyncio.sleep(30)
                     continue
+                self.timings["telnet"] = round(time.monotonic() - t, 3)
 
                 # if not mqtt - enable it (handle Mi Home and ZHA mode)
-                if not await self.prepare_gateway() or \
-                        not await self.mqtt.connect(self.host):
+                t = time.monotonic()
+                async with self.prepare_semaphore:
+                    self.timings["prepare_wait"] = round(
+                        time.monotonic() - t, 3
+                    )
+                    ok = await self.prepare_gateway()
+                self.timings["prepare"] = round(time.monotonic() - t, 3)
+                if not ok or not await self.mqtt.connect(self.host):
                     await asyncio.sleep(60)
                     continue
 
                 await self.mqtt_connect()
+                if "startup" not in self.timings:
+                    self.timings["startup"] = round(
+                        time.monotonic() - self.start_ts, 3
+                    )
                 try:
                     async for msg in self.mqtt:
-                        # noinspection PyTypeChecker
-                        asyncio.create_task(self.mqtt_message(msg))
+                        await self.mqtt_dispatch(msg)
                 except Exception as e:
                     self.debug(f"MQTT connection issue", exc_info=e)
                 finally:
@@ -120,6 +222,9 @@ class XGateway(GateGW3, GateE1):
         while True:
             ts = time.time()
             self.check_available(ts)
+            if self.stats_enable and self.device:
+                payload = self.device.decode(GATEWAY, self.mqtt_stats())
+                self.device.update(payload)
             await self.dispatcher_send(SIGNAL_TIMER, ts=ts)
             await asyncio.sleep(30)
 
@@ -14,6 +14,7 @@ SIGNAL_PREPARE_GW = "prepare_gateway"
 SIGNAL_MQTT_CON = "mqtt_connect"
 SIGNAL_MQTT_DIS = "mqtt_disconnect"
 SIGNAL_MQTT_PUB = "mqtt_publish"
+SIGNAL_MIOT_PROPERTIES = "miot_properties"
 SIGNAL_TIMER = "timer"
 
 
@@ -26,8 +27,12 @@ class GatewayBase:
     # - Mesh: did, "123456789", X digits
     # - Mesh group: did, "group.123456789"
     devices: Dict[str, XDevice] = {}
+    # secondary index for BLE events that carry only the numeric did
+    devices_by_did: Dict[str, XDevice] = {}
     # key - mac, 6 byte hex for gw and bluetooth, 8 byte hex for zb with "0x"
     defaults: Dict[str, dict] = {}
+    # key - gateway host, devices from the last run to setup before connect
+    restore: Dict[str, List[list]] = {}
 
     log: Logger = None
 
@@ -120,11 +125,17 @@ class GatewayBase:
             handler(self, device, conv)
 
     def add_device(self, did: str, device: XDevice):
+        # device confirmed by gateway, not only restored from the last run
+        restored = device.extra.pop("restored", None)
+
         if did not in self.devices:
             self.devices[did] = device
+        if device.did:
+            self.devices_by_did.setdefault(device.did, device)
 
         if self not in device.gateways:
             device.gateways.append(self)
+            device.extra.setdefault("gateway_host", self.host)
 
         # don't setup device with unknown model
         if not device.model:
@@ -139,6 +150,10 @@ class GatewayBase:
         if len(device.gateways) > 1:
             return
 
+        # entities were already setup when this gateway restored the device
+        if restored == self.host and device.entities:
+            return
+
         device.setup_entitites(self, stats=self.stats_enable)
         self.debug_device(
             device, f"setup {device.info.model}:",
@@ -77,9 +77,7 @@ class BLEGateway(GatewayBase):
                 )
                 self.add_device(mac, device)
         else:
-            device = next((
-                d for d in self.devices.values() if d.did == data['dev']['did']
-            ), None)
+            device = self.devices_by_did.get(data['dev']['did'])
             if not device:
                 self.debug(f"Unregistered BLEE device {data}")
                 return
@@ -105,9 +103,7 @@ class BLEGateway(GatewayBase):
     async def ble_process_event_fix(self, payload: dict):
         # {'did':'blt.3.xxx','eid':4104,'edata':'0b','pdid':152,'seq':3}
 
-        device = next((
-            d for d in self.devices.values() if d.did == payload['did']
-        ), None)
+        device = self.devices_by_did.get(payload['did'])
 
         if not device:
             self.debug(f"Unregistered BLEF device {payload}")
@@ -25,8 +25,10 @@ class LumiGateway(GatewayBase):
 
     async def lumi_read_devices(self, sh: shell.TelnetShell):
         # 2. Read zigbee devices
-        raw = await sh.read_file('/data/zigbee/device.info')
-        lumi = json.loads(raw)['devInfo']
+        raw = await sh.read_file_cached(
+            '/data/zigbee/device.info', parse=json.loads
+        )
+        lumi = raw['devInfo']
 
         for item in lumi:
             did = item["did"]
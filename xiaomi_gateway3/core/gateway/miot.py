@@ -1,8 +1,7 @@
 import json
-import re
 from typing import Dict, List, Optional
 
-from .base import GatewayBase, SIGNAL_MQTT_PUB
+from .base import GatewayBase, SIGNAL_MQTT_PUB, SIGNAL_MIOT_PROPERTIES
 from ..device import XDevice
 from ..mini_mqtt import MQTTMessage
 
@@ -28,6 +27,8 @@ class MIoTGateway(GatewayBase):
         """Can receive multiple properties from multiple devices.
            data = [{'did':123,'siid':2,'piid':1,'value:True}]
         """
+        await self.dispatcher_send(SIGNAL_MIOT_PROPERTIES, data=data)
+
         # convert miio response format to multiple responses in lumi format
         devices: Dict[str, Optional[list]] = {}
         for item in data:
@@ -70,22 +71,42 @@ class MIoTGateway(GatewayBase):
 
 
 # new miio adds colors to logs
-RE_JSON1 = re.compile(b'msg:(.+) length:([0-9]+) bytes')
-RE_JSON2 = re.compile(b'{.+}')
+MSG_START = b'msg:'
+MSG_LENGTH = b' length:'
+MSG_BYTES = b' bytes'
 EMPTY_RESPONSE = []
 
 
 def decode_miio_json(raw: bytes, search: bytes) -> List[dict]:
     """There can be multiple concatenated json on one line. And sometimes the
-    length does not match the message."""
+    length does not match the message.
+
+    Fragment bounds are found with bytes.find on the original line, so only
+    the fragments with the search token are copied and parsed.
+    """
     if search not in raw:
         return EMPTY_RESPONSE
-    m = RE_JSON1.search(raw)
-    if m:
-        length = int(m[2])
-        raw = m[1][:length]
+
+    start = raw.find(MSG_START)
+    end = raw.rfind(MSG_LENGTH)
+    size = raw.find(MSG_BYTES, end) if end >= 0 else -1
+    if 0 <= start < end < size and raw[end + len(MSG_LENGTH):size].isdigit():
+        start += len(MSG_START)
+        end = min(end, start + int(raw[end + len(MSG_LENGTH):size]))
     else:
-        m = RE_JSON2.search(raw)
-        raw = m[0]
-    items = raw.replace(b'}{', b'}\n{').split(b'\n')
-    return [json.loads(raw) for raw in items if search in raw]
+        start = -1
+
+    if start < 0:
+        start = raw.find(b'{')
+        end = raw.rfind(b'}') + 1
+        if start < 0 or end <= start:
+            return EMPTY_RESPONSE
+
+    items = []
+    while start < end:
+        pos = raw.find(b'}{', start, end)
+        stop = pos + 1 if pos >= 0 else end
+        if raw.find(search, start, stop) >= 0:
+            items.append(json.loads(raw[start:stop]))
+        start = stop
+    return items
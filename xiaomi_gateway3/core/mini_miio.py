@@ -8,7 +8,7 @@ import time
 from asyncio import DatagramProtocol, Future
 from asyncio.protocols import BaseProtocol
 from asyncio.transports import DatagramTransport
-from typing import Union
+from typing import Dict, Optional, Union
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
@@ -199,24 +199,26 @@ class SyncMiIO(BasemiIO):
 
 
 # noinspection PyUnusedLocal
-class AsyncSocket(DatagramProtocol):
-    timeout = 0
+class MiIOProtocol(DatagramProtocol):
+    """Long-lived UDP socket to one miIO device. Passes all received packets
+    to the AsyncMiIO, which matches responses to requests by message id.
+    """
     transport: DatagramTransport = None
-    response: Future = None
 
-    def __init__(self):
-        self.response = asyncio.get_event_loop().create_future()
+    def __init__(self, miio: 'AsyncMiIO'):
+        self.miio = miio
 
     def connection_made(self, transport: DatagramTransport):
-        # _LOGGER.debug(f"connection_made {transport}")
         self.transport = transport
 
     def datagram_received(self, data: bytes, addr):
-        # _LOGGER.debug(f"datagram_received {data}")
-        self.response.set_result(data)
+        self.miio.datagram_received(data)
 
-    def settimeout(self, value: int):
-        self.timeout = value
+    def error_received(self, exc: Exception):
+        self.miio.protocol_lost(self)
+
+    def connection_lost(self, exc):
+        self.miio.protocol_lost(self)
 
     def sendto(self, data: bytes):
         self.transport.sendto(data)
@@ -229,35 +231,130 @@ class AsyncSocket(DatagramProtocol):
         except Exception:
             _LOGGER.exception("Error when closing async socket")
 
-    async def connect(self, addr: tuple):
-        coro = asyncio.get_event_loop().create_datagram_endpoint(
-            lambda: self, remote_addr=addr
-        )
-        if self.timeout:
-            await asyncio.wait_for(coro, self.timeout)
-        else:
-            await coro
-
-    async def recv(self, *args):
-        self.response = asyncio.get_event_loop().create_future()
-        if self.timeout:
-            return await asyncio.wait_for(self.response, self.timeout)
-        return await self.response
-
 
 # noinspection PyMethodMayBeStatic,PyTypeChecker
 class AsyncMiIO(BasemiIO, BaseProtocol):
-    async def ping(self, sock: AsyncSocket) -> bool:
+    """Asynchronous miIO protocol over one persistent socket per device.
+
+    Requests are multiplexed: many can be in flight at the same time and
+    responses are matched by message id. The socket is closed after
+    `idle_timeout` seconds without requests and reopened on demand.
+    """
+    max_inflight = 4
+    idle_timeout = 60
+
+    protocol: MiIOProtocol = None
+    hello: Future = None
+    # smoothed round trip time of answered requests in seconds
+    rtt: float = None
+
+    def __init__(self, host: str, token: str, timeout: float = 3):
+        super().__init__(host, token, timeout)
+        self.pending: Dict[int, Future] = {}
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.lock: Optional[asyncio.Lock] = None
+        self.idle_handle: Optional[asyncio.TimerHandle] = None
+
+    def datagram_received(self, raw: bytes):
+        if raw[:2] != b'\x21\x31':
+            return
+
+        if len(raw) == 32:
+            # answer on hello
+            if self.hello and not self.hello.done():
+                self.hello.set_result(raw)
+            return
+
+        try:
+            data = self._unpack_raw(raw).rstrip(b'\x00')
+        except Exception as e:
+            _LOGGER.debug(f"{self.addr[0]} | can't decrypt answer", exc_info=e)
+            return
+
+        if data == b'':
+            # mgl03 fw 1.4.6_0012 without Internet respond on miIO.info
+            # command with empty answer, it can only be matched if there is
+            # one request in flight
+            if len(self.pending) == 1:
+                fut = next(iter(self.pending.values()))
+                if not fut.done():
+                    fut.set_result(None)
+            return
+
+        try:
+            data = json.loads(data)
+            fut = self.pending.get(data['id'])
+        except Exception as e:
+            _LOGGER.debug(f"{self.addr[0]} | wrong answer {data}", exc_info=e)
+            return
+
+        if fut is None:
+            _LOGGER.debug(f"{self.addr[0]} | wrong answer ID")
+        elif not fut.done():
+            fut.set_result(data)
+
+    def protocol_lost(self, protocol: MiIOProtocol):
+        if protocol is self.protocol:
+            self.close()
+
+    async def connect(self) -> MiIOProtocol:
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+
+        async with self.lock:
+            if self.protocol is None:
+                protocol = MiIOProtocol(self)
+                coro = asyncio.get_event_loop().create_datagram_endpoint(
+                    lambda: protocol, remote_addr=self.addr
+                )
+                await asyncio.wait_for(coro, self.timeout)
+                self.protocol = protocol
+
+        if self.idle_handle:
+            self.idle_handle.cancel()
+        self.idle_handle = asyncio.get_event_loop().call_later(
+            self.idle_timeout, self.close
+        )
+        return self.protocol
+
+    def close(self):
+        if self.idle_handle:
+            self.idle_handle.cancel()
+            self.idle_handle = None
+        if self.protocol:
+            self.protocol.close()
+            self.protocol = None
+        for fut in self.pending.values():
+            if not fut.done():
+                fut.set_exception(ConnectionError())
+        if self.hello and not self.hello.done():
+            # ping treats an empty hello as no answer
+            self.hello.set_result(None)
+
+    async def ping(self, sock: MiIOProtocol) -> bool:
         """Returns `true` if the connection to the miio device is working. The
-        token is not verified at this stage.
+        token is not verified at this stage. Concurrent requests share one
+        hello.
         """
+        if self.hello is None or self.hello.done():
+            self.hello = asyncio.get_event_loop().create_future()
+            try:
+                sock.sendto(HELLO)
+            except Exception:
+                self.hello = None
+                return False
+        hello = self.hello
         try:
-            sock.sendto(HELLO)
-            raw = await sock.recv(1024)
-            if raw[:2] == b'\x21\x31':
-                self.device_id = int.from_bytes(raw[8:12], 'big')
-                self.delta_ts = time.time() - int.from_bytes(raw[12:16], 'big')
-                return True
+            raw = await asyncio.wait_for(asyncio.shield(hello), self.timeout)
+            self.device_id = int.from_bytes(raw[8:12], 'big')
+            self.delta_ts = time.time() - int.from_bytes(raw[12:16], 'big')
+            return True
+        except asyncio.TimeoutError:
+            # no answer, release other waiters and send a new hello next time
+            if not hello.done():
+                hello.set_result(None)
+            if self.hello is hello:
+                self.hello = None
         except Exception:
             pass
         return False
@@ -272,53 +369,60 @@ class AsyncMiIO(BasemiIO, BaseProtocol):
         - {'id':123,'result':...} - device answered on cmd with good result
         - {'id':123,'error':...}
         """
-        offline = False
-        for times in range(1, 4):
-            sock = AsyncSocket()
-            sock.settimeout(self.timeout)
-            try:
-                # create socket every time for reset connection, because we can
-                # reseive answer on previous request or request from another
-                # thread
-                await sock.connect(self.addr)
-
-                # need device_id for send command, can get it from ping cmd
-                if self.delta_ts is None and not await self.ping(sock):
-                    # device doesn't answered on ping
-                    offline = True
-                    continue
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_inflight)
 
-                # pack each time for new message id
-                msg_id = random.randint(100000000, 999999999)
-                raw_send = self._pack_raw(msg_id, method, params)
-                sock.sendto(raw_send)
-                # can receive more than 1024 bytes (1056 approximate maximum)
-                raw_recv = await sock.recv(10240)
-                data = self._unpack_raw(raw_recv).rstrip(b'\x00')
-
-                if data == b'':
-                    # mgl03 fw 1.4.6_0012 without Internet respond on miIO.info
-                    # command with empty answer
-                    continue
-
-                data = json.loads(data)
-                # check if we received response for our cmd
-                if data['id'] != msg_id:
-                    _LOGGER.debug(f"{self.addr[0]} | wrong answer ID")
-                    continue
-
-                return data
-
-            except (asyncio.TimeoutError, OSError):
-                # OSError: [Errno 101] Network unreachable
-                pass
-            except Exception as e:
-                _LOGGER.debug(f"{self.addr[0]} | {method}", exc_info=e)
-            finally:
-                sock.close()
-
-            # init ping again
-            self.delta_ts = None
+        offline = False
+        async with self.semaphore:
+            for times in range(1, 4):
+                msg_id = None
+                try:
+                    sock = await self.connect()
+
+                    # need device_id for send command, can get it from ping
+                    if self.delta_ts is None and not await self.ping(sock):
+                        # device doesn't answered on ping
+                        offline = True
+                        continue
+
+                    # pack each time for new message id
+                    msg_id = random.randint(100000000, 999999999)
+                    while msg_id in self.pending:
+                        msg_id = random.randint(100000000, 999999999)
+                    raw_send = self._pack_raw(msg_id, method, params)
+
+                    fut = asyncio.get_event_loop().create_future()
+                    self.pending[msg_id] = fut
+                    t = time.monotonic()
+                    sock.sendto(raw_send)
+                    data = await asyncio.wait_for(fut, self.timeout)
+                    t = time.monotonic() - t
+                    self.rtt = t if self.rtt is None else \
+                        0.8 * self.rtt + 0.2 * t
+
+                    if data is None:
+                        # empty answer
+                        continue
+
+                    if self.debug:
+                        _LOGGER.debug(
+                            f"{self.addr[0]} | Send {method} {len(raw_send)}B "
+                            f"in {t:.2f} sec and {times} try"
+                        )
+
+                    return data
+
+                except (asyncio.TimeoutError, OSError):
+                    # OSError: [Errno 101] Network unreachable
+                    pass
+                except Exception as e:
+                    _LOGGER.debug(f"{self.addr[0]} | {method}", exc_info=e)
+                finally:
+                    if msg_id is not None:
+                        self.pending.pop(msg_id, None)
+
+                # init ping again
+                self.delta_ts = None
 
         if offline:
             _LOGGER.warning(f"{self.addr[0]} | Device offline")
@@ -329,12 +433,16 @@ class AsyncMiIO(BasemiIO, BaseProtocol):
 
     async def send_bulk(self, method: str, params: list) -> list:
         """Sends a command with a large number of parameters. Splits into
-        multiple requests when the size of one request is exceeded.
+        multiple requests when the size of one request is exceeded. Requests
+        are sent concurrently and results are joined in order.
         """
         try:
+            resps = await asyncio.gather(*[
+                self.send(method, params[i:i + 15])
+                for i in range(0, len(params), 15)
+            ])
             result = []
-            for i in range(0, len(params), 15):
-                resp = await self.send(method, params[i:i + 15])
+            for resp in resps:
                 result += resp['result']
             return result
         except Exception:
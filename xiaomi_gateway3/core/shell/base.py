@@ -1,8 +1,15 @@
 import asyncio
 import base64
+import re
 from asyncio import StreamReader, StreamWriter
 from dataclasses import dataclass
-from typing import Union
+from typing import Any, Callable, Dict, Tuple, Union
+
+RE_STAT = re.compile(r"^\S+ \d+ \d+$")
+
+# (host, filename) -> (stat, parsed content), shared between sessions, so
+# unchanged files aren't transferred again when the gateway is set up again
+FILES_CACHE: Dict[Tuple[str, str], Tuple[str, Any]] = {}
 
 
 @dataclass
@@ -35,6 +42,33 @@ class TelnetShell:
         except Exception:
             return None
 
+    async def read_file_cached(self, filename: str, as_base64=False,
+                               parse: Callable = None):
+        """Read file only if its name, size or mtime changed since the last
+        read with this gateway. Returns parsed content if parse is set.
+        """
+        try:
+            stat = (await self.exec(f"stat -c '%n %s %Y' {filename}")).strip()
+        except Exception:
+            stat = None
+
+        if stat and RE_STAT.match(stat):
+            host = self.writer.get_extra_info("peername")[0]
+            key = (host, filename)
+            cached = FILES_CACHE.get(key)
+            if cached and cached[0] == stat:
+                return cached[1]
+        else:
+            key = None
+
+        raw = await self.read_file(filename, as_base64)
+        if raw is None:
+            return None
+        data = parse(raw) if parse else raw
+        if key:
+            FILES_CACHE[key] = (stat, data)
+        return data
+
     async def reboot(self):
         # should not wait for response
         self.writer.write(b"reboot\n")
@@ -250,8 +250,9 @@ class ShellGw3(TelnetShell):
 
     async def read_db_bluetooth(self) -> SQLite:
         if not self.db:
-            raw = await self.read_file(DB_BLUETOOTH, as_base64=True)
-            self.db = SQLite(raw)
+            self.db = await self.read_file_cached(
+                DB_BLUETOOTH, as_base64=True, parse=SQLite
+            )
         return self.db
 
     @property
@@ -88,6 +88,9 @@ class SQLite:
         self.raw = raw
         self.read_db_header()
         self.tables = self.read_page(0)
+        # rows of already parsed tables, the object is reused while the
+        # file on the gateway doesn't change
+        self.rows = {}
 
     @property
     def size(self):
@@ -201,5 +204,7 @@ class SQLite:
         return rows + self.read_page(last_page_num - 1)
 
     def read_table(self, name: str):
-        page = next(t[3] - 1 for t in self.tables if t[1] == name)
-        return self.read_page(page)
+        if name not in self.rows:
+            page = next(t[3] - 1 for t in self.tables if t[1] == name)
+            self.rows[name] = self.read_page(page)
+        return self.rows[name]
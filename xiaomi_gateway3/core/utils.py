@@ -18,7 +18,7 @@ from homeassistant.requirements import async_process_requirements
 
 from . import shell
 from .const import DOMAIN
-from .converters import STAT_GLOBALS
+from .converters import STAT_GLOBALS, GATEWAY, MESH_GROUP_MODEL
 from .device import XDevice
 from .ezsp import EzspUtils
 from .gateway import XGateway
@@ -114,16 +114,34 @@ async def load_devices(hass: HomeAssistant, yaml_devices: dict):
     devices = await store.async_load()
     if devices:
         for k, v in devices.items():
+            # [host, type, model, did, nwk, fw_ver] of the device in last run
+            if restore := v.pop("restore", None):
+                XGateway.restore.setdefault(restore[0], []).append(
+                    [k] + restore[1:]
+                )
             XGateway.defaults.setdefault(k, {}).update(v)
 
     # noinspection PyUnusedLocal
     async def stop(*args):
         # save devices data to .storage
-        data = {
-            d.mac: {"decode_ts": d.decode_ts}
-            for d in XGateway.devices.values()
-            if d.decode_ts
-        }
+        data = {}
+        for d in XGateway.devices.values():
+            item = {}
+            if d.decode_ts:
+                item["decode_ts"] = d.decode_ts
+            # skip devices that were restored but not confirmed by gateway,
+            # gateways are read first anyway and mesh groups need childs
+            if (
+                    "gateway_host" in d.extra and d.model and
+                    "restored" not in d.extra and d.type != GATEWAY and
+                    d.model != MESH_GROUP_MODEL
+            ):
+                item["restore"] = [
+                    d.extra["gateway_host"], d.type, d.model, d.did, d.nwk,
+                    d.extra.get("fw_ver")
+                ]
+            if item:
+                data[d.mac] = item
         await store.async_save(data)
 
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop)
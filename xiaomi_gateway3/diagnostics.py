@@ -36,10 +36,17 @@ async def async_get_config_entry_diagnostics(
     except Exception as e:
         errors = f"{type(e).__name__}: {e}"
 
+    try:
+        gw: XGateway = hass.data[DOMAIN][entry.entry_id]
+        timings = gw.timings
+    except Exception as e:
+        timings = f"{type(e).__name__}: {e}"
+
     return {
         "version": source_hash(),
         "options": options,
         "errors": errors,
+        "timings": timings,
         "devices": devices,
     }
 
@@ -55,7 +55,8 @@ from .core.xiaomi_cloud import (
     MiCloudAccessDenied,
 )
 from .core.miio2miot import Miio2MiotHelper
-from .core.templates import CUSTOM_TEMPLATES
+from .core.chunk_sizer import ChunkSizer
+from .core.templates import get_template
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -196,6 +197,7 @@ async def async_setup(hass, hass_config: dict):
 
     component = EntityComponent(_LOGGER, DOMAIN, hass, SCAN_INTERVAL)
     hass.data[DOMAIN]['component'] = component
+    hass.bus.async_listen(f'{DOMAIN}.properties_changed', partial(async_handle_properties_changed, hass))
     await component.async_setup(config)
     await async_setup_component_services(hass)
     bind_services_to_entries(hass, SERVICE_TO_METHOD_BASE)
@@ -353,6 +355,7 @@ async def async_update_options(hass: hass_core.HomeAssistant, config_entry: conf
     entry.pop('ssecurity', None)
     _LOGGER.debug('Xiaomi Miot update options: %s', entry)
     hass.data[DOMAIN]['sub_entities'] = {}
+    hass.data[DOMAIN]['templates'] = {}
     await hass.config_entries.async_reload(config_entry.entry_id)
 
 
@@ -380,6 +383,27 @@ def init_integration_data(hass):
     hass.data[DOMAIN].setdefault('miot_specs', {})
     hass.data[DOMAIN].setdefault('add_entities', {})
     hass.data[DOMAIN].setdefault('sub_entities', {})
+    hass.data[DOMAIN].setdefault('chunk_sizer', ChunkSizer(hass))
+    hass.data[DOMAIN].setdefault('push_entities', {})
+    hass.data[DOMAIN].setdefault('templates', {})
+
+
+async def async_handle_properties_changed(hass, event):
+    """
+    Pushed property changes, same format as the miot properties_changed message:
+    {"params": [{"did": "123", "siid": 2, "piid": 1, "value": true}]}
+    """
+    pls = event.data.get('params')
+    if pls is None:
+        pls = [event.data]
+    dids = {}
+    for p in cv.ensure_list(pls):
+        if not isinstance(p, dict) or 'did' not in p:
+            continue
+        dids.setdefault(str(p['did']), []).append(p)
+    for did, params in dids.items():
+        for ent in list(hass.data[DOMAIN]['push_entities'].get(did) or []):
+            await ent.async_push_properties(params)
 
 
 def bind_services_to_entries(hass, services):
@@ -426,6 +450,7 @@ def bind_services_to_entries(hass, services):
 
 async def async_reload_integration_config(hass, config):
     hass.data[DOMAIN]['config'] = config
+    hass.data[DOMAIN]['templates'] = {}
 
     if lang := config.get('language'):
         dic = TRANSLATION_LANGUAGES.get(lang)
@@ -1023,9 +1048,7 @@ class MiioEntity(BaseEntity):
             for tpl in tps:
                 if not tpl:
                     continue
-                tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                tpl = cv.template(tpl)
-                tpl.hass = self.hass
+                tpl = get_template(self.hass, tpl)
                 adt = tpl.render({'data': self._state_attrs}) or {}
                 if isinstance(adt, dict):
                     if adt.pop('_override', False):
@@ -1125,6 +1148,52 @@ class MiotEntity(MiioEntity):
         if not self._miot_service:
             return
         self._vars['ignore_offline'] = self.custom_config_bool('ignore_offline')
+        if (did := self.miot_did) and self.custom_config_bool('miot_push', True):
+            pes = self.hass.data[DOMAIN]['push_entities'].setdefault(str(did), set())
+            pes.add(self)
+            self.async_on_remove(partial(pes.discard, self))
+
+    def _mapping_props(self):
+        return {
+            f'prop.{v.get("siid")}.{v.get("piid")}'
+            for v in (self.miot_mapping or {}).values()
+            if isinstance(v, dict)
+        }
+
+    async def async_push_properties(self, params: list):
+        pls = self._mapping_props()
+        rls = [
+            {**p, 'code': p.get('code', 0)}
+            for p in params
+            if f'prop.{p.get("siid")}.{p.get("piid")}' in pls
+        ]
+        if not rls:
+            return
+        result = MiotResults(rls, self.miot_mapping)
+        if not result.is_valid:
+            return
+        self._vars['push_time'] = time.time()
+        # apply the pushed values only, fetching stays in the regular poll
+        attrs = result.to_attributes(self._state_attrs)
+        attrs['state_updater'] = 'push'
+        self._available = True
+        await self.async_update_attrs(attrs, update_subs=True)
+        self._state = True if self._state_attrs.get('power') else False
+        for sub in list(self._subs.values()):
+            if getattr(sub, '_attr', None) in attrs and hasattr(sub, 'update_from_parent'):
+                sub.update_from_parent()
+        self.async_write_ha_state()
+
+    def _skip_update_for_push(self):
+        """
+        While the device keeps pushing property changes,
+        polling only runs as a watchdog every push_poll_interval seconds.
+        """
+        now = time.time()
+        ttl = self.custom_config_integer('push_poll_interval') or 600
+        if now - self._vars.get('push_time', 0) > ttl:
+            return False
+        return now - self._vars.get('poll_time', 0) <= ttl
 
     @property
     def miot_device(self):
@@ -1264,6 +1333,9 @@ class MiotEntity(MiioEntity):
         if self._vars.get('delay_update'):
             await asyncio.sleep(self._vars.get('delay_update'))
             self._vars.pop('delay_update', 0)
+        elif self._skip_update_for_push():
+            return
+        self._vars['poll_time'] = time.time()
         updater = 'none'
         attrs = {}
         results = None
@@ -1290,10 +1362,10 @@ class MiotEntity(MiioEntity):
             use_local = False
             use_cloud = False
             results = []
-
         if use_local:
             updater = 'lan'
             max_properties = 10
+            chunk_sizer = None
             try:
                 if self._miio2miot:
                     results = await self._miio2miot.async_get_miot_props(self.miot_device, local_mapping)
@@ -1301,20 +1373,8 @@ class MiotEntity(MiioEntity):
                 else:
                     max_properties = self.custom_config_integer('chunk_properties')
                     if not max_properties:
-                        idx = len(local_mapping)
-                        if idx >= 10:
-                            idx -= 10
-                        chunks = [
-                            # 10,11,12,13,14,15,16,17,18,19
-                            10, 6, 6, 7, 7, 8, 8, 9, 9, 10,
-                            # 20,21,22,23,24,25,26,27,28,29
-                            10, 7, 8, 8, 8, 9, 9, 9, 10, 10,
-                            # 30,31,32,33,34,35,36,37,38,39
-                            10, 8, 8, 7, 7, 7, 9, 9, 10, 10,
-                            # 40,41,42,43,44,45,46,47,48,49
-                            10, 9, 9, 9, 9, 9, 10, 10, 10, 10,
-                        ]
-                        max_properties = 10 if idx >= len(chunks) else chunks[idx]
+                        chunk_sizer = self.hass.data[DOMAIN]['chunk_sizer']
+                        max_properties = await chunk_sizer.async_get_size(self._model, len(local_mapping))
                     results = await self.hass.async_add_executor_job(
                         partial(
                             self._device.get_properties_for_mapping,
@@ -1323,8 +1383,12 @@ class MiotEntity(MiioEntity):
                             mapping=local_mapping,
                         )
                     )
+                    if chunk_sizer:
+                        chunk_sizer.success(self._model, max_properties, len(local_mapping))
                 self._local_state = True
             except (DeviceException, OSError) as exc:
+                if chunk_sizer and not is_offline_exception(exc):
+                    chunk_sizer.failure(self._model, max_properties)
                 log = self.logger.error
                 if self.custom_config_bool('auto_cloud'):
                     use_cloud = self.xiaomi_cloud
@@ -1342,9 +1406,7 @@ class MiotEntity(MiioEntity):
             updater = 'cloud'
             try:
                 mic = self.xiaomi_cloud
-                results = await self.hass.async_add_executor_job(
-                    partial(mic.get_properties_for_mapping, self.miot_did, mapping)
-                )
+                results = await mic.async_get_properties_for_mapping(self.miot_did, mapping)
                 if self.custom_config_bool('check_lan'):
                     if self.miot_device:
                         await self.hass.async_add_executor_job(self.miot_device.info)
@@ -1600,9 +1662,7 @@ class MiotEntity(MiioEntity):
 
         tpl = self.custom_config('miio_cloud_props_template')
         if tpl and props:
-            tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-            tpl = cv.template(tpl)
-            tpl.hass = self.hass
+            tpl = get_template(self.hass, tpl)
             attrs = tpl.render({'props': props})
         else:
             attrs = props
@@ -1629,9 +1689,7 @@ class MiotEntity(MiioEntity):
             rdt = mic.get_user_device_data(did, key, typ, **kws) or []
             tpl = self.custom_config(f'miio_{typ}_{key}_template')
             if tpl:
-                tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                tpl = cv.template(tpl)
-                tpl.hass = self.hass
+                tpl = get_template(self.hass, tpl)
                 rls = tpl.render({'result': rdt})
             else:
                 rls = [
@@ -1669,9 +1727,7 @@ class MiotEntity(MiioEntity):
             self.logger.debug('%s: Got micloud statistics: %s', self.name_model, rdt)
             tpl = c.get('template')
             if tpl:
-                tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                tpl = cv.template(tpl)
-                tpl.hass = self.hass
+                tpl = get_template(self.hass, tpl)
                 rls = tpl.render(rdt)
             else:
                 rls = [
@@ -0,0 +1,96 @@
+import logging
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# 10,11,12,...,49 properties
+DEFAULT_CHUNKS = [
+    10, 6, 6, 7, 7, 8, 8, 9, 9, 10,
+    10, 7, 8, 8, 8, 9, 9, 9, 10, 10,
+    10, 8, 8, 7, 7, 7, 9, 9, 10, 10,
+    10, 9, 9, 9, 9, 9, 10, 10, 10, 10,
+]
+
+
+class ChunkSizer:
+    """
+    Learns per model how many properties a device answers reliably in one get_properties call.
+    The size grows by one after a run of successful polls and backs off to the last good size
+    when a poll fails, the learned sizes are persisted in the storage directory.
+    """
+    max_size = 20
+    probe_after = 10
+    forget_after = 100
+
+    def __init__(self, hass):
+        self.hass = hass
+        self.store = Store(hass, 1, f'{DOMAIN}/chunk_properties.json')
+        self.models = None
+
+    @staticmethod
+    def default_size(total: int):
+        idx = total
+        if idx >= 10:
+            idx -= 10
+        return 10 if idx >= len(DEFAULT_CHUNKS) else DEFAULT_CHUNKS[idx]
+
+    async def async_load(self):
+        if self.models is None:
+            dat = await self.store.async_load() or {}
+            self.models = {
+                k: {'size': v.get('size'), 'good': v.get('good', 0), 'ceil': v.get('ceil', 0), 'times': 0}
+                for k, v in dat.items()
+                if isinstance(v, dict) and v.get('size')
+            }
+        return self.models
+
+    async def async_get_size(self, model, total: int):
+        mls = await self.async_load()
+        if model not in mls:
+            mls[model] = {'size': self.default_size(total), 'good': 0, 'ceil': 0, 'times': 0}
+        return max(1, min(mls[model]['size'], total or 1))
+
+    def success(self, model, size: int, total: int):
+        cur = (self.models or {}).get(model)
+        if not cur:
+            return
+        changed = size > cur['good']
+        cur['good'] = max(cur['good'], size)
+        cur['times'] += 1
+        if cur['ceil'] and cur['times'] >= self.forget_after:
+            # give a size that failed once another chance
+            cur['ceil'] = 0
+            changed = True
+        if cur['times'] >= self.probe_after and size == cur['size'] and size < min(total, self.max_size):
+            if not cur['ceil'] or size + 1 < cur['ceil']:
+                cur['size'] = size + 1
+                cur['times'] = 0
+                changed = True
+        if changed:
+            self.save()
+
+    def failure(self, model, size: int):
+        cur = (self.models or {}).get(model)
+        if not cur:
+            return
+        if size > 1 and (not cur['ceil'] or size < cur['ceil']):
+            cur['ceil'] = size
+        if cur['good'] >= size:
+            cur['good'] = 0
+        nxt = cur['good'] if 0 < cur['good'] < size else max(1, size // 2)
+        cur['size'] = min(cur['size'], nxt)
+        cur['times'] = 0
+        _LOGGER.debug('Reduce chunk properties for %s to %s', model, cur['size'])
+        self.save()
+
+    def save(self):
+        self.store.async_delay_save(self.data_to_save, 10)
+
+    def data_to_save(self):
+        return {
+            k: {'size': v['size'], 'good': v['good'], 'ceil': v['ceil']}
+            for k, v in (self.models or {}).items()
+        }
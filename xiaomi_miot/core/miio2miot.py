@@ -6,7 +6,7 @@ from functools import partial
 
 from .utils import is_offline_exception
 from .miot_spec import (MiotSpec, MiotProperty, MiotAction)
-from .templates import CUSTOM_TEMPLATES
+from .templates import get_template
 from .miio2miot_specs import MIIO_TO_MIOT_SPECS
 import homeassistant.helpers.config_validation as cv
 
@@ -83,9 +83,7 @@ class Miio2MiotHelper:
                 if kls is True:
                     kls = c.get('params', [])
                 if tpl := c.get('template'):
-                    tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                    tpl = cv.template(tpl)
-                    tpl.hass = self.hass
+                    tpl = get_template(self.hass, tpl)
                     pdt = tpl.render({'results': vls})
                     if isinstance(pdt, dict):
                         dic.update(pdt)
@@ -93,9 +91,7 @@ class Miio2MiotHelper:
                     if len(kls) == len(vls):
                         dic.update(dict(zip(kls, vls)))
         if tpl := self.config.get('miio_template'):
-            tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-            tpl = cv.template(tpl)
-            tpl.hass = self.hass
+            tpl = get_template(self.hass, tpl)
             pdt = tpl.render({'props': dic})
             if isinstance(pdt, dict):
                 dic.update(pdt)
@@ -126,9 +122,7 @@ class Miio2MiotHelper:
                     fmt = c.get('format')
                     try:
                         if tpl := c.get('template', {}):
-                            tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                            tpl = cv.template(tpl)
-                            tpl.hass = self.hass
+                            tpl = get_template(self.hass, tpl)
                             val = tpl.render({
                                 'value': val,
                                 'props': dic,
@@ -185,9 +179,7 @@ class Miio2MiotHelper:
             mph = MiioPropertyHelper(prop, reverse=True)
             fmt = cfg.get('format')
             if tpl := cfg.get('set_template'):
-                tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                tpl = cv.template(tpl)
-                tpl.hass = self.hass
+                tpl = get_template(self.hass, tpl)
                 pms = tpl.render({
                     'value': value,
                     'props': self.miio_props_values,
@@ -234,9 +226,7 @@ class Miio2MiotHelper:
         act = self.miot_spec.specs.get(key)
         if act and isinstance(act, MiotAction):
             if tpl := cfg.get('set_template'):
-                tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
-                tpl = cv.template(tpl)
-                tpl.hass = self.hass
+                tpl = get_template(self.hass, tpl)
                 pms = tpl.render({
                     'params': pms,
                     'props': self.miio_props_values,
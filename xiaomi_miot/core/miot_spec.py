@@ -1,12 +1,14 @@
 import logging
 import asyncio
 import platform
+import pickle
 import random
 import time
+import os
 import re
 
 from homeassistant.const import *
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import Store, STORAGE_DIR
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
@@ -19,6 +21,9 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# bump when the attributes of the spec classes change, to drop stale binary caches
+SPEC_CACHE_VERSION = 1
+
 # https://iot.mi.com/new/doc/guidelines-for-access/other-platform-access/control-api#MIOT%E7%8A%B6%E6%80%81%E7%A0%81
 SPEC_ERRORS = {
     '000': 'Unknown',
@@ -63,6 +68,8 @@ SPEC_ERRORS = {
 # https://iot.mi.com/new/doc/tools-and-resources/design/spec/xiaoai
 # https://iot.mi.com/new/doc/tools-and-resources/design/spec/shortcut
 class MiotSpecInstance:
+    __slots__ = ('raw', 'iid', 'type', 'name', 'description')
+
     def __init__(self, dat: dict):
         self.raw = dat
         self.iid = int(dat.get('iid') or 0)
@@ -232,16 +239,45 @@ class MiotSpec(MiotSpecInstance):
     async def async_get_model_type(hass, model, use_remote=False):
         if not model:
             return None
+        dat = await MiotSpec.async_get_instances(hass, use_remote)
+        return (dat.get(model) or {}).get('type')
+
+    @staticmethod
+    async def async_get_instances(hass, use_remote=False):
+        """
+        Instances index keyed by model, kept in memory and shared by all callers.
+        The index is loaded once and refreshed when it is older than 7 days.
+        """
+        cache = hass.data.setdefault(DOMAIN, {}).setdefault('spec_instances', {})
+        lock = cache.setdefault('lock', asyncio.Lock())
+        now = int(time.time())
+        if not use_remote and cache.get('index') and now < cache.get('expires', 0):
+            return cache['index']
+        async with lock:
+            # other callers may have refreshed the index while waiting for the lock
+            if cache.get('index') and now < cache.get('expires', 0):
+                if not use_remote or cache.get('remote_time', 0) >= now:
+                    return cache['index']
+            dat, ptm = await MiotSpec._async_load_instances(hass, use_remote)
+            if use_remote and ptm >= now:
+                cache['remote_time'] = ptm
+            cache['index'] = dat
+            # retry failed downloads after an hour instead of on every call
+            cache['expires'] = max(ptm + 86400 * 7, now + 3600)
+        return dat
+
+    @staticmethod
+    async def _async_load_instances(hass, use_remote=False):
         fnm = f'{DOMAIN}/instances.json'
         store = Store(hass, 1, fnm)
         cached = await store.async_load() or {}
         now = int(time.time())
+        ctm = cached.pop('_updated_time', 0)
         dat = {}
-        if not use_remote:
+        ptm = 0
+        if not use_remote and cached and now - ctm <= 86400 * 7:
             dat = cached
-            ptm = dat.pop('_updated_time', 0)
-            if dat and now - ptm > 86400 * 7:
-                dat = {}
+            ptm = ctm
         if not dat:
             try:
                 url = '/miot-spec-v2/instances?status=all'
@@ -262,47 +298,73 @@ class MiotSpec(MiotSpecInstance):
                         sdt[m] = v
                     await store.async_save(sdt)
                     dat = sdt
+                    ptm = dat.pop('_updated_time', now)
                     _LOGGER.info(
-                        'Renew miot spec instances: %s, count: %s, model: %s',
-                        fnm, len(sdt) - 1, model,
+                        'Renew miot spec instances: %s, count: %s',
+                        fnm, len(sdt),
                     )
             except (TypeError, ValueError, BaseException) as exc:
                 if not cached:
                     raise exc
                 dat = cached
+                ptm = 0
                 _LOGGER.warning('Get miot specs filed: %s, use cached.', exc)
-        typ = None
         if 'instances' in dat:
+            idx = {}
             for v in (dat.get('instances') or []):
-                if model == v.get('model'):
-                    typ = v.get('type')
-                    break
-        elif model in dat:
-            typ = dat[model].get('type')
-        return typ
+                idx.setdefault(v.get('model'), v)
+            dat = idx
+        return dat, ptm
 
     @staticmethod
     async def async_from_type(hass, typ):
+        """
+        Parsed spec trees are kept pickled in memory and in a file next to the json store.
+        Every caller gets its own copy, as entities customize their spec.
+        """
+        cache = hass.data.setdefault(DOMAIN, {}).setdefault('spec_trees', {})
+        locks = hass.data[DOMAIN].setdefault('spec_trees_locks', {})
+        lock = locks.setdefault(typ, asyncio.Lock())
+        async with lock:
+            now = int(time.time())
+            ent = cache.get(typ)
+            if ent and now < ent[1]:
+                return pickle.loads(ent[0])
+            spec, expires = await MiotSpec._async_load_spec_tree(hass, typ)
+            cache[typ] = (pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL), expires)
+        return spec
+
+    @staticmethod
+    async def _async_load_spec_tree(hass, typ):
         fnm = f'{DOMAIN}/{typ}.json'
         if platform.system() == 'Windows':
             fnm = fnm.replace(':', '_')
+        pkl = hass.config.path(STORAGE_DIR, f'{fnm[:-5]}.pickle')
+        now = int(time.time())
+        dmp = await hass.async_add_executor_job(MiotSpec._read_spec_tree, pkl)
+        if dmp and dmp.get('version') == SPEC_CACHE_VERSION and now < dmp.get('expires', 0):
+            return dmp['spec'], dmp['expires']
+
         store = Store(hass, 1, fnm)
         cached = await store.async_load() or {}
         dat = cached
         ptm = dat.pop('_updated_time', 0)
-        now = int(time.time())
         ttl = 60
         if dat.get('services'):
             ttl = 86400 * random.randint(30, 50)
         if dat and now - ptm > ttl:
             dat = {}
         if not dat.get('type'):
+            ptm = now
             try:
                 url = f'/miot-spec-v2/instance?type={typ}'
                 dat = await MiotSpec.async_download_miot_spec(hass, url, tries=3)
                 dat['_updated_time'] = now
                 await store.async_save(dat)
+                dat.pop('_updated_time', None)
+                ttl = 86400 * random.randint(30, 50)
             except (TypeError, ValueError, BaseException) as exc:
+                ttl = 60
                 if cached:
                     dat = cached
                 else:
@@ -313,7 +375,38 @@ class MiotSpec(MiotSpecInstance):
                     }
                     await store.async_save(dat)
                     _LOGGER.warning('Get miot-spec for %s failed: %s', typ, exc)
-        return MiotSpec(dat)
+        spec = MiotSpec(dat)
+        expires = ptm + ttl
+        if dat.get('services'):
+            try:
+                raw = pickle.dumps({
+                    'version': SPEC_CACHE_VERSION,
+                    'expires': expires,
+                    'spec': spec,
+                }, protocol=pickle.HIGHEST_PROTOCOL)
+                await hass.async_add_executor_job(MiotSpec._write_spec_tree, pkl, raw)
+            except (OSError, pickle.PicklingError) as exc:
+                _LOGGER.info('Save miot-spec cache for %s failed: %s', typ, exc)
+        return spec, expires
+
+    @staticmethod
+    def _read_spec_tree(path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as file:
+                return pickle.load(file)
+        except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError) as exc:
+            _LOGGER.info('Load miot-spec cache %s failed: %s', path, exc)
+        return None
+
+    @staticmethod
+    def _write_spec_tree(path, raw: bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.tmp'
+        with open(tmp, 'wb') as file:
+            file.write(raw)
+        os.replace(tmp, path)
 
     @staticmethod
     def unique_prop(siid, piid=None, aiid=None, eiid=None, valid=False):
@@ -511,6 +604,11 @@ class MiotService(MiotSpecInstance):
 
 # https://miot-spec.org/miot-spec-v2/spec/properties
 class MiotProperty(MiotSpecInstance):
+    __slots__ = (
+        'service', 'siid', 'unique_name', 'unique_prop', 'desc_name', 'friendly_name', 'friendly_desc',
+        'format', 'access', 'unit', 'value_list', 'value_range', 'full_name',
+    )
+
     def __init__(self, dat: dict, service: MiotService):
         self.service = service
         self.siid = service.iid
@@ -850,6 +948,11 @@ class MiotProperty(MiotSpecInstance):
 
 # https://miot-spec.org/miot-spec-v2/spec/actions
 class MiotAction(MiotSpecInstance):
+    __slots__ = (
+        'service', 'siid', 'unique_name', 'unique_prop', 'full_name', 'friendly_name', 'friendly_desc',
+        'ins', 'out',
+    )
+
     def __init__(self, dat: dict, service: MiotService):
         self.service = service
         self.siid = service.iid
@@ -1,3 +1,7 @@
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+
 CUSTOM_TEMPLATES = {
     # https://iot.mi.com/new/doc/embedded-development/ble/object-definition#%E7%89%99%E5%88%B7%E4%BA%8B%E4%BB%B6
     'ble_toothbrush_events': "{%- set dat = props.get('event.16') | default('{}',true) | from_json %}"
@@ -182,3 +186,21 @@ CUSTOM_TEMPLATES = {
                                      "'month': dat.month | round(3),"
                                      "} }}",
 }
+
+
+def get_template(hass, tpl):
+    """
+    Compiled templates are cached by source in hass.data, so devices of the same model
+    share one parsed template. The cache is cleared when the integration config is reloaded.
+    """
+    tpl = CUSTOM_TEMPLATES.get(tpl, tpl)
+    if not isinstance(tpl, str):
+        tpl = cv.template(tpl)
+        tpl.hass = hass
+        return tpl
+    cache = hass.data.setdefault(DOMAIN, {}).setdefault('templates', {})
+    if (cached := cache.get(tpl)) is None:
+        cached = cv.template(tpl)
+        cached.hass = hass
+        cache[tpl] = cached
+    return cached
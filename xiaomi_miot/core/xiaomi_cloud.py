@@ -1,4 +1,5 @@
 import logging
+import asyncio
 import json
 import time
 import base64
@@ -35,9 +36,14 @@ class MiotCloud(micloud.MiCloud):
         self.default_server = country or 'cn'
         self.sid = sid or 'xiaomiio'
         self.client_id = self.agent_id
-        self.http_timeout = int(hass.data[DOMAIN].get('config', {}).get('http_timeout') or 10)
+        cfg = hass.data[DOMAIN].get('config', {})
+        self.http_timeout = int(cfg.get('http_timeout') or 10)
+        self.batch_window = float(cfg.get('cloud_batch_window') or 0.5)
+        self.batch_size = int(cfg.get('cloud_batch_size') or 150)
         self.login_times = 0
         self.attrs = {}
+        self._batch_pending = []
+        self._batch_handle = None
 
     @property
     def unique_id(self):
@@ -45,6 +51,82 @@ class MiotCloud(micloud.MiCloud):
         return f'{uid}-{self.default_server}-{self.sid}'
 
     def get_properties_for_mapping(self, did, mapping: dict):
+        pms, rmp = self.mapping_to_params(did, mapping)
+        rls = self.get_props(pms)
+        return self.results_for_mapping(rls, rmp)
+
+    async def async_get_properties_for_mapping(self, did, mapping: dict):
+        """
+        Same as get_properties_for_mapping, but the request is queued for a short window
+        and sent together with the pending reads of other devices on this account.
+        """
+        pms, rmp = self.mapping_to_params(did, mapping)
+        if not pms:
+            return None
+        fut = self.hass.loop.create_future()
+        self._batch_pending.append((pms, fut))
+        cnt = sum(len(p) for p, _ in self._batch_pending)
+        if cnt >= self.batch_size:
+            self._flush_batch()
+        elif not self._batch_handle:
+            self._batch_handle = self.hass.loop.call_later(self.batch_window, self._flush_batch)
+        rls = await fut
+        return self.results_for_mapping(rls, rmp)
+
+    def _flush_batch(self):
+        if self._batch_handle:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        pending = self._batch_pending
+        self._batch_pending = []
+        if pending:
+            self.hass.async_create_task(self._async_send_batch(pending))
+
+    async def _async_send_batch(self, pending: list):
+        pms = {}
+        for params, _ in pending:
+            for p in params:
+                pms.setdefault(self.prop_key(p), p)
+        lst = list(pms.values())
+        chunks = [
+            lst[i:i + self.batch_size]
+            for i in range(0, len(lst), self.batch_size)
+        ]
+        rls = await asyncio.gather(
+            *[self.hass.async_add_executor_job(self.get_props, c) for c in chunks],
+            return_exceptions=True,
+        )
+        results = {}
+        errors = {}
+        for chunk, rsp in zip(chunks, rls):
+            if isinstance(rsp, Exception):
+                for p in chunk:
+                    errors[self.prop_key(p)] = rsp
+                continue
+            for v in rsp or []:
+                if isinstance(v, dict):
+                    results[self.prop_key(v)] = v
+        _LOGGER.debug(
+            'Batched %s properties of %s requests into %s cloud requests',
+            len(lst), len(pending), len(chunks),
+        )
+        for params, fut in pending:
+            if fut.done():
+                continue
+            keys = [self.prop_key(p) for p in params]
+            dls = [dict(results[k]) for k in keys if k in results]
+            exc = next((errors[k] for k in keys if k in errors), None)
+            if exc and not dls:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(dls or None)
+
+    @staticmethod
+    def prop_key(prop: dict):
+        return f"{prop.get('did')}.{prop.get('siid')}.{prop.get('piid')}"
+
+    @staticmethod
+    def mapping_to_params(did, mapping: dict):
         pms = []
         rmp = {}
         for k, v in mapping.items():
@@ -54,7 +136,10 @@ class MiotCloud(micloud.MiCloud):
             p = v.get('piid')
             pms.append({'did': str(did), 'siid': s, 'piid': p})
             rmp[f'prop.{s}.{p}'] = k
-        rls = self.get_props(pms)
+        return pms, rmp
+
+    @staticmethod
+    def results_for_mapping(rls, rmp: dict):
         if not rls:
             return None
         dls = []
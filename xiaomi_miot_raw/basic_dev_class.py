@@ -122,6 +122,7 @@ class GenericMiotDevice(Entity):
             self._ctrl_params_new = paramsnew
         else:
             self._ctrl_params_new = self._ctrl_params
+        self.build_value_indexes()
 
         if mi_type:
             self._ctrl_params = self._ctrl_params[mi_type]
@@ -155,7 +156,7 @@ class GenericMiotDevice(Entity):
             c = setup_cloud(self, hass)
             self._cloud_instance = c[0]
             self.coordinator = c[1]
-            self.coordinator.add_fixed_by_mapping(self._cloud, self._mapping)
+            self.coordinator.add_fixed_by_mapping(self._cloud, self._mapping, self._ctrl_params_new)
 
             data1 = {}
             data1['datasource'] = 1
@@ -557,12 +558,38 @@ class GenericMiotDevice(Entity):
 
 
 
+    def build_value_indexes(self):
+        """预先建立 value -> key 的反向索引，设备重新配置后会重新创建实体，索引随之重建"""
+        self._value_indexes = {}
+        for v in self._ctrl_params_new.values():
+            if isinstance(v, dict):
+                self._index_values(v)
+                if isinstance(vl := v.get('value_list'), dict):
+                    self._index_values(vl)
+
+    def _index_values(self, d:dict):
+        rev = {}
+        for k,v in d.items():
+            try:
+                # 与原来的列表推导一致，重复的值取第一个 key
+                rev.setdefault(v, k)
+            except TypeError:
+                continue
+        self._value_indexes[id(d)] = (d, rev)
+        return rev
+
     def get_key_by_value(self, d:dict, value):
+        idx = self._value_indexes.get(id(d))
+        rev = idx[1] if idx and idx[0] is d else self._index_values(d)
         try:
-            return [k for k,v in d.items() if v == value][0]
-        except (KeyError, ValueError, IndexError):
-            _LOGGER.info(f"get_key_by_value: {value} is not in dict{json.dumps (d)}!")
-            return None
+            if value in rev:
+                return rev[value]
+        except TypeError:
+            for k,v in d.items():
+                if v == value:
+                    return k
+        _LOGGER.debug(f"get_key_by_value: {value} is not in the value list!")
+        return None
 
     def convert_value(self, value, param, dir = True, valuerange = None):
         if value is None:
@@ -905,6 +932,7 @@ class MiotIRDevice(GenericMiotDevice):
                     mappingnew[f"{k}_{kk}"] = vv
             self._mapping = mappingnew
         self._ctrl_params = config.get(CONF_CONTROL_PARAMS) or {}
+        self._value_indexes = {}
 
         self._name = config.get(CONF_NAME)
         self._did_prefix = did_prefix + '_'
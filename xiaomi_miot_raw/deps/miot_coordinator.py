@@ -21,6 +21,7 @@ from homeassistant.helpers.storage import Store
 from homeassistant.util import color
 from miio.exceptions import DeviceException
 from .miio_new import MiotDevice
+from .miot_device_adapter import ACCESS_WRITE, ACCESS_NOTIFY
 import copy
 import math
 from collections import OrderedDict
@@ -45,6 +46,33 @@ from asyncio.exceptions import CancelledError
 
 _LOGGER = logging.getLogger(__name__)
 
+# 轮询分级：每个档位每隔多少个更新周期（6 秒）请求一次
+POLL_TIERS = {
+    'fast': 1,
+    'normal': 5,
+    'slow': 50,
+}
+# 单个请求最多包含的属性数，超出部分拆成多个请求并发发送
+MAX_PROPS_PER_REQUEST = 80
+# 设备离线时云端返回的错误码
+OFFLINE_CODE = -704042011
+
+
+def get_poll_tier(key, params = None):
+    """ 优先使用 params 中的 poll_tier，否则按 spec 中的 access 推断：
+        可写或无 access 信息的属性快速轮询，只读且会上报的属性普通轮询，
+        只读且不上报的属性（滤芯寿命、累计用量等）慢速轮询 """
+    if not isinstance(params, dict):
+        return 'fast'
+    if params.get('poll_tier') in POLL_TIERS:
+        return params['poll_tier']
+    access = params.get('access')
+    if not isinstance(access, int) or access & ACCESS_WRITE:
+        return 'fast'
+    if access & ACCESS_NOTIFY:
+        return 'normal'
+    return 'slow'
+
 class MiotCloudCoordinator(DataUpdateCoordinator):
     """Manages polling for state changes from the device.
        One for each account."""
@@ -60,40 +88,94 @@ class MiotCloudCoordinator(DataUpdateCoordinator):
         )
         self._cloud_instance = cloud
         self._error_count = 0
-        self._fixed_list = []
+        self._fixed_list = {} # (did, siid, piid) -> (params, tier)
         self._waiting_list = [] # 请求的params
-        self._results = {}
+        self._never_polled = set()
+        self._tick = 0
+        self._results = {} # did -> {(siid, piid): item}
+        self._offline = set() # 离线的 did
 
-    def add_fixed_by_mapping(self, cloudconfig, mapping):
+    def add_fixed_by_mapping(self, cloudconfig, mapping, params = None):
         did = cloudconfig.get("did")
-        for value in mapping.values():
+        params = params or {}
+        for key, value in mapping.items():
             if 'aiid' not in value:
-                self._fixed_list.append({**{'did':did},**value})
+                pkey = (did, value.get('siid'), value.get('piid'))
+                tier = get_poll_tier(key, params.get(key))
+                if pkey in self._fixed_list:
+                    # 多个实体共用同一属性时，按最快的档位轮询
+                    old = self._fixed_list[pkey][1]
+                    if POLL_TIERS[old] <= POLL_TIERS[tier]:
+                        continue
+                else:
+                    self._never_polled.add(pkey)
+                self._fixed_list[pkey] = ({**{'did':did},**value}, tier)
 
+    def _due_params(self):
+        due = []
+        for pkey, (prop, tier) in self._fixed_list.items():
+            if self._tick % POLL_TIERS[tier] == 0 or pkey in self._never_polled:
+                due.append(prop)
+        self._never_polled.clear()
+        return due + self._waiting_list
 
-    async def _async_update_data(self):
-        """ 覆盖定期执行的方法 """
-        # _LOGGER.info(f"{self._name} is updating from cloud.")
+    async def _async_get_chunk(self, params):
         data1 = {}
         data1['datasource'] = 1
-        data1['params'] = self._fixed_list + self._waiting_list
+        data1['params'] = params
         data2 = json.dumps(data1,separators=(',', ':'))
+        try:
+            a = await self._cloud_instance.get_props(data2)
+        except (CancelledError, asyncio.TimeoutError):
+            raise
+        except Exception as ex:
+            _LOGGER.warning(f"Failed to get {len(params)} properties from cloud: {ex}")
+            return None
+        if not a or not isinstance(a.get('result'), list):
+            return None
+        return a['result']
+
+    async def _async_update_data(self):
+        """ 覆盖定期执行的方法 """
+        # _LOGGER.info(f"{self._name} is updating from cloud.")
+        params = self._due_params()
+        self._waiting_list = []
+        self._tick += 1
 
-        a = await self._cloud_instance.get_props(data2)
+        chunks = [
+            params[i:i + MAX_PROPS_PER_REQUEST]
+            for i in range(0, len(params), MAX_PROPS_PER_REQUEST)
+        ]
+        resps = await asyncio.gather(*[self._async_get_chunk(c) for c in chunks])
 
         # dict1 = {}
         # statedict = {}
-        if a:
-            # self._available = True
-            result = a['result']
-            results = {}
+        fresh = {}
+        for chunk, result in zip(chunks, resps):
+            if result is None:
+                # 请求失败的属性保留上次的值，下个周期重新请求
+                for p in chunk:
+                    if (pkey := (p['did'], p.get('siid'), p.get('piid'))) in self._fixed_list:
+                        self._never_polled.add(pkey)
+                continue
             for item in result:
-                if item['did'] not in results:
-                    results[item['did']] = [item]
-                else:
-                    results[item['did']].append(item)
-            self._waiting_list = []
-            return results
+                fresh.setdefault(item['did'], {})[(item.get('siid'), item.get('piid'))] = item
+
+        for did, items in fresh.items():
+            if all(item.get('code') == OFFLINE_CODE for item in items.values()):
+                # 设备离线时丢弃其他档位缓存的旧值，否则离线检测永远不成立
+                self._results[did] = items
+                self._offline.add(did)
+                continue
+            if did in self._offline:
+                # 设备重新上线，下个周期立即请求所有档位的属性
+                self._offline.discard(did)
+                self._never_polled.update(pkey for pkey in self._fixed_list if pkey[0] == did)
+            self._results.setdefault(did, {}).update(items)
+
+        if chunks and not any(r is not None for r in resps) and not self._results:
+            raise UpdateFailed("Failed to get properties from cloud")
+        return {did: list(items.values()) for did, items in self._results.items()}
 
 class MiotEventCoordinator(DataUpdateCoordinator):
     def __init__(self, hass, cloud: MiCloud, cloud_config, item):